@@ -1,4 +1,3 @@
-import time
 import csv
 from datetime import datetime
 import sqlite3
@@ -6,10 +5,26 @@ import re
 import argparse
 import zlib
 import os
+import functools
+import mmap
 import signal
 import sys
-from bs4 import BeautifulSoup  # type: ignore
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from itertools import zip_longest
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
+
+# Optional: ISA-L computes the same CRC-32 (gzip/zlib polynomial) several times faster
+try:
+    from isal.isal_zlib import crc32 as _crc32  # type: ignore
+except ImportError:
+    _crc32 = zlib.crc32
 
 from clients import get_client
 
@@ -24,6 +39,15 @@ DEBUG_MODE = os.getenv("DEBUG", "").lower() in ("true", "1", "yes", "on")
 # Global flag for graceful shutdown
 _shutdown_requested = False
 
+# Database holding validators and bodies for conditional GETs; None disables the HTTP cache
+_http_cache_db_path = None
+
+# Per-thread HTTP cache connections (pages are fetched from worker threads; sqlite3 connections are not shared)
+_http_cache_local = threading.local()
+
+# Config directories already created this run, so config path lookups don't hit the filesystem
+_ensured_config_dirs = set()
+
 # Shutdown message constant
 _SHUTDOWN_MESSAGE = "Shutdown requested, stopping fetch operation..."
 
@@ -43,22 +67,51 @@ def _signal_handler(signum, frame):
 
 # Define regex to extract CRC32 from filename text (commonly in [xxxxx])
 CRC32_REGEX = re.compile(r"\[([A-Fa-f0-9]{8})\]")
+# Matches only the last CRC32 tag in a string, so a single search() replaces findall()[-1]
+LAST_CRC32_REGEX = re.compile(r"\[([A-Fa-f0-9]{8})\](?!.*\[[A-Fa-f0-9]{8}\])")
+# Release tags sit at the end of names ("...[1080p][XXXXXXXX].mkv"), so search this many trailing chars first
+CRC32_TAIL_LENGTH = 32
+
+# The only accepted quality marker, matched case-insensitively ("[1080P]" too)
+QUALITY_MARKER = "[1080p]"
+
+# Matches whole lines of file-list text naming a [One Pace] 1080p file with a CRC32 tag
+EPISODE_FILENAME_LINE_REGEX = re.compile(
+    r"^(?=.*\[One Pace\])(?=.*(?i:\[1080p\])).*\[[A-Fa-f0-9]{8}\].*$", re.MULTILINE
+)
 
-# Quality regex patterns - matches [1080p], etc. (case insensitive)
-QUALITY_REGEX = re.compile(r"\[(\d+p)\]", re.IGNORECASE)
+# Characters not allowed in renamed filenames, as a str.translate() table that deletes them
+FILENAME_SANITIZE_TABLE = str.maketrans("", "", '\\/*?:"<>|')
 
 # Video file extensions we care about
 VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi"}
+# Same extensions as a tuple for str.endswith(), which avoids os.path.splitext per file
+VIDEO_SUFFIXES = tuple(VIDEO_EXTENSIONS)
+# Only this many trailing characters of a name are lowercased for the extension check
+VIDEO_SUFFIX_MAX_LENGTH = max(len(ext) for ext in VIDEO_EXTENSIONS)
 
 # Constants for repeated string literals
-HTML_PARSER = "html.parser"
+HTML_PARSER = "lxml"
 NYAA_BASE_URL = "https://nyaa.si"
+# Only build the parts of Nyaa pages we read; skips soup objects for headers, scripts, etc.
+LISTING_PAGE_STRAINER = SoupStrainer(["table", "ul"], class_=["torrent-list", "pagination"])
+TORRENT_PAGE_STRAINER = SoupStrainer("div", class_="torrent-file-list")
 ONE_PACE_MARKER = "[One Pace]"
 
 # HTTP and network constants
 HTTP_OK = 200
-REQUEST_DELAY_SECONDS = 0.2
-CRC32_CHUNK_SIZE = 8192
+HTTP_NOT_MODIFIED = 304
+NYAA_MAX_WORKERS = 4  # Concurrent listing page fetches (kept low to stay polite to Nyaa)
+HTTP_TIMEOUT = (5, 20)  # (connect, read) seconds
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_USER_AGENT = "Ace-Pace (One Pace library manager)"
+HTTP_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # Seconds a cached page may go unvalidated before it is pruned
+CRC32_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB reads keep per-chunk syscall/interpreter overhead negligible
+CRC32_MAX_WORKERS = min(4, os.cpu_count() or 1)  # Files hashed in parallel (one per core, capped so spinning disks don't thrash)
+CRC32_CACHE_BATCH_SIZE = 50  # Hashed files per cache commit (small, since each file takes seconds to hash)
+SQLITE_IN_BATCH_SIZE = 500  # Max bound parameters per "IN (...)" lookup (under SQLite's variable limit)
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024  # 1 MiB file buffer for CSV exports
+TORRENT_PAGE_CACHE_SIZE = 4096  # Torrent file lists memoized per run (keyed on page link)
 MAGNET_LINK_PREFIX = "magnet:"
 
 # Config and media directory defaults (override via env: ACEPACE_CONFIG_DIR_*, ACEPACE_MEDIA_DIR_*)
@@ -68,11 +121,136 @@ MEDIA_DIR_DOCKER_DEFAULT = "/media"
 MEDIA_DIR_LOCAL_DEFAULT = ""
 DB_NAME = "crc32_files.db"
 EPISODES_DB_NAME = "episodes_index.db"
+HTTP_CACHE_DB_NAME = "http_cache.db"
 MISSING_CSV_FILENAME = "Ace-Pace_Missing.csv"
 DB_CSV_FILENAME = "Ace-Pace_DB.csv"
 CSV_COLUMN_MAGNET_LINK = "Magnet Link"
 
 
+def _create_http_session():
+    """Create the shared HTTP session used for all Nyaa requests.
+    Keeps connections alive across requests (no new TCP/TLS handshake per page) and
+    retries transient errors with backoff. After retries the last response is returned
+    so callers still see and report its status code."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = HTTP_USER_AGENT
+    return session
+
+
+_HTTP_SESSION = _create_http_session()
+
+
+def _enable_http_cache():
+    """Send conditional GETs for Nyaa pages, keeping validators and bodies in HTTP_CACHE_DB_NAME.
+    Pages not validated within HTTP_CACHE_MAX_AGE are pruned here, so the cache only holds
+    pages still in use."""
+    global _http_cache_db_path
+    try:
+        with closing(init_http_cache_db()) as conn, conn:
+            conn.execute(
+                "DELETE FROM http_cache WHERE validated_at < ?", (time.time() - HTTP_CACHE_MAX_AGE,)
+            )
+    except sqlite3.Error as e:
+        debug_print(f"DEBUG: HTTP cache disabled, could not open it: {e}")
+        return
+    _http_cache_db_path = get_config_path(HTTP_CACHE_DB_NAME)
+
+
+def _http_cache_connection():
+    """Get this thread's connection to the HTTP cache, opening it on first use.
+    Reopened if the cache was enabled on another path since."""
+    conn = getattr(_http_cache_local, "conn", None)
+    if conn is None or _http_cache_local.db_path != _http_cache_db_path:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(_http_cache_db_path)
+        _http_cache_local.conn = conn
+        _http_cache_local.db_path = _http_cache_db_path
+    return conn
+
+
+def _load_cached_page(url):
+    """Look up the cached (etag, last_modified, body) for a URL, or None if not cached."""
+    return _http_cache_connection().execute(
+        "SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (url,)
+    ).fetchone()
+
+
+def _store_cached_page(url, resp):
+    """Cache a 200 response's body if the server sent validators to revalidate it with.
+    Bodies are stored zlib-compressed; Nyaa's HTML shrinks several times over."""
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    conn = _http_cache_connection()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, validated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (url, etag, last_modified, zlib.compress(resp.text.encode("utf-8")), time.time()),
+        )
+
+
+def _touch_cached_page(url):
+    """Mark a cached page as validated now (after a 304), so pruning keeps it."""
+    conn = _http_cache_connection()
+    with conn:
+        conn.execute("UPDATE http_cache SET validated_at = ? WHERE url = ?", (time.time(), url))
+
+
+def _cached_response(url, body):
+    """Build a 200 response carrying a cached body, so callers handle a 304 like a fresh page."""
+    resp = requests.Response()
+    resp.status_code = HTTP_OK
+    resp.url = url
+    resp.encoding = "utf-8"
+    resp._content = zlib.decompress(body)
+    return resp
+
+
+def _http_get(url):
+    """GET a URL through the shared session with the default timeout.
+    When the HTTP cache is enabled, pages fetched before are revalidated with
+    If-None-Match/If-Modified-Since and a 304 is answered from the cached body."""
+    if _http_cache_db_path is None:
+        return _HTTP_SESSION.get(url, timeout=HTTP_TIMEOUT)
+    try:
+        cached = _load_cached_page(url)
+    except sqlite3.Error as e:
+        debug_print(f"DEBUG: Could not read cache entry for {url}: {e}")
+        cached = None
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    resp = _HTTP_SESSION.get(url, timeout=HTTP_TIMEOUT, headers=headers)
+    if resp.status_code == HTTP_NOT_MODIFIED and cached:
+        try:
+            _touch_cached_page(url)
+        except sqlite3.Error as e:
+            debug_print(f"DEBUG: Could not refresh cache entry for {url}: {e}")
+        return _cached_response(url, cached[2])
+    if resp.status_code == HTTP_OK:
+        try:
+            _store_cached_page(url, resp)
+        except sqlite3.Error as e:
+            debug_print(f"DEBUG: Could not cache {url}: {e}")
+    return resp
+
+
 def _get_release_date():
     """Release date from modification time of this file (no repo commits, no extra file)."""
     try:
@@ -84,15 +262,16 @@ def _get_release_date():
 
 def get_config_dir():
     """Get the config directory path based on Docker mode.
-    Returns the config directory path, creating it if necessary.
+    Returns the config directory path, creating it the first time it is requested in a run.
     Override via ACEPACE_CONFIG_DIR_DOCKER (Docker) or ACEPACE_CONFIG_DIR_LOCAL (local).
     """
     if IS_DOCKER:
         config_dir = os.getenv("ACEPACE_CONFIG_DIR_DOCKER", CONFIG_DIR_DOCKER_DEFAULT)
     else:
         config_dir = os.getenv("ACEPACE_CONFIG_DIR_LOCAL", CONFIG_DIR_LOCAL_DEFAULT)
-    if not os.path.exists(config_dir):
+    if config_dir not in _ensured_config_dirs:
         os.makedirs(config_dir, exist_ok=True)
+        _ensured_config_dirs.add(config_dir)
     return config_dir
 
 
@@ -133,6 +312,37 @@ def normalize_file_path(file_path):
         return os.path.normpath(os.path.abspath(file_path))
 
 
+# crc32_cache schema; {table} is the table name, optionally prefixed with IF NOT EXISTS.
+# crc32 is not UNIQUE: identical copies of an episode in two folders must both stay cached.
+CRC32_CACHE_TABLE_SQL = """
+    CREATE TABLE {table} (
+        file_path TEXT PRIMARY KEY,
+        crc32 TEXT,
+        size INTEGER,
+        mtime REAL
+    ) WITHOUT ROWID
+"""
+
+
+def _drop_crc32_unique_constraint(conn):
+    """Migrate crc32_cache tables created with "crc32 TEXT UNIQUE" to the current schema.
+    SQLite can't drop a constraint in place, so rows are copied into a new table once."""
+    c = conn.cursor()
+    c.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'crc32_cache'")
+    row = c.fetchone()
+    if not row or "UNIQUE" not in row[0].upper():
+        return
+    c.execute("DROP TABLE IF EXISTS crc32_cache_new")  # Leftover from an interrupted migration
+    c.execute(CRC32_CACHE_TABLE_SQL.format(table="crc32_cache_new"))
+    c.execute(
+        "INSERT INTO crc32_cache_new (file_path, crc32, size, mtime) "
+        "SELECT file_path, crc32, size, mtime FROM crc32_cache"
+    )
+    c.execute("DROP TABLE crc32_cache")
+    c.execute("ALTER TABLE crc32_cache_new RENAME TO crc32_cache")
+    conn.commit()
+
+
 def init_db(suppress_messages=False):
     """Initialize the database.
     Args:
@@ -141,29 +351,63 @@ def init_db(suppress_messages=False):
     db_path = get_config_path(DB_NAME)
     exists = os.path.exists(db_path)
     conn = sqlite3.connect(db_path)
+    # WAL with synchronous=NORMAL: cache commits append to the log instead of fsyncing the
+    # main file each time, which keeps batched writes cheap during long hashing runs
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     c = conn.cursor()
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS crc32_cache (
-            file_path TEXT PRIMARY KEY,
-            crc32 TEXT UNIQUE
-        )
-    """
-    )
+    c.execute(CRC32_CACHE_TABLE_SQL.format(table="IF NOT EXISTS crc32_cache"))
+    # Add size/mtime columns if they don't exist (for existing databases); used to detect changed files
+    for column in ("size INTEGER", "mtime REAL"):
+        try:
+            c.execute(f"ALTER TABLE crc32_cache ADD COLUMN {column}")
+        except sqlite3.OperationalError:
+            # Column already exists, ignore
+            pass
+    _drop_crc32_unique_constraint(conn)
+    # file_path lookups use the primary key; this index serves lookups and joins by CRC32
+    c.execute("CREATE INDEX IF NOT EXISTS idx_crc32_cache_crc32 ON crc32_cache (crc32)")
     c.execute(
         """
         CREATE TABLE IF NOT EXISTS metadata (
             key TEXT PRIMARY KEY,
             value TEXT
-        )
+        ) WITHOUT ROWID
     """
     )
+    # The HTTP cache now has its own database (init_http_cache_db); drop the table older versions kept here
+    c.execute("DROP TABLE IF EXISTS http_cache")
     conn.commit()
     if exists and not suppress_messages:
         print("Database already exists. You can export it using the --db option.")
     return conn
 
 
+def init_http_cache_db():
+    """Initialize the HTTP cache database.
+    Kept apart from crc32_files.db, since it only holds disposable Nyaa page bodies
+    and is written from the fetch worker threads.
+    Returns: Database connection object."""
+    conn = sqlite3.connect(get_config_path(HTTP_CACHE_DB_NAME))
+    # WAL lets worker threads read cached pages while another thread stores one
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Nyaa pages with their ETag/Last-Modified, for conditional GETs on later runs.
+    # A rowid table, since rows hold whole page bodies
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS http_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            body BLOB,
+            validated_at REAL
+        )
+    """
+    )
+    conn.commit()
+    return conn
+
+
 # --- New: Episodes metadata DB ---
 def init_episodes_db():
     """Initialize the episodes index database.
@@ -193,9 +437,11 @@ def init_episodes_db():
         CREATE TABLE IF NOT EXISTS metadata (
             key TEXT PRIMARY KEY,
             value TEXT
-        )
+        ) WITHOUT ROWID
         """
     )
+    # Torrent pages without any episode file, skipped on later updates
+    c.execute("CREATE TABLE IF NOT EXISTS no_crc_pages (page_link TEXT PRIMARY KEY) WITHOUT ROWID")
     conn.commit()
     return conn
 
@@ -228,25 +474,20 @@ def set_episodes_metadata(conn, key, value):
 # --- New: Fetch and update episodes_index table ---
 def _is_valid_quality(fname_text):
     """Check if filename has valid quality (1080p only).
-    Returns True if quality is 1080p, False otherwise."""
-    quality_matches = QUALITY_REGEX.findall(fname_text)
-    if not quality_matches:
-        return False  # No quality marker found, exclude
-    # Check if quality is exactly 1080p (not higher, not lower)
-    for quality in quality_matches:
-        quality_num = int(quality.lower().replace('p', ''))
-        if quality_num == 1080:
-            return True
-    return False  # Quality not 1080p
+    Plain substring tests; the lower-cased copy is only made when the exact-case marker is absent.
+    Returns True if quality is 1080p, False otherwise (other or missing quality marker)."""
+    return QUALITY_MARKER in fname_text or QUALITY_MARKER in fname_text.lower()
 
 
 def _process_fname_entry(fname_text, seen_crc32, episodes, page_link, magnet_link=""):
     """Helper to extract CRC32 from fname_text and store if valid and unique.
     Only accepts episodes with 1080p quality."""
-    m = CRC32_REGEX.findall(fname_text)
     found = False
-    if m and ONE_PACE_MARKER in fname_text and _is_valid_quality(fname_text):
-        crc32 = m[-1].upper()
+    # Cheap marker/quality gates first so non-qualifying names skip the CRC32 scan
+    if ONE_PACE_MARKER not in fname_text or not _is_valid_quality(fname_text):
+        return found
+    crc32 = _extract_crc32_from_text(fname_text)
+    if crc32:
         if crc32 not in seen_crc32:
             # print(f"New CRC32 detected: {crc32} -> Title: {fname_text}")
             episodes.append((crc32, fname_text, page_link, magnet_link))
@@ -255,6 +496,16 @@ def _process_fname_entry(fname_text, seen_crc32, episodes, page_link, magnet_lin
     return found
 
 
+def _parse_listing_page(html):
+    """Parse a Nyaa search results page, keeping only the torrent table and pagination."""
+    return BeautifulSoup(html, HTML_PARSER, parse_only=LISTING_PAGE_STRAINER)
+
+
+def _parse_torrent_page(html):
+    """Parse a Nyaa torrent page, keeping only the file list."""
+    return BeautifulSoup(html, HTML_PARSER, parse_only=TORRENT_PAGE_STRAINER)
+
+
 def _get_total_pages(soup):
     """Extract total number of pages from pagination controls."""
     total_pages = 1
@@ -284,105 +535,179 @@ def _extract_title_link_from_row(row):
     return None
 
 
-def _extract_filenames_from_folder_structure(filelist_div):
-    """Extract filenames from folder structure in file list."""
-    all_uls = filelist_div.find_all("ul")
-    filenames = []
-    for ul in all_uls:
-        for file_li in ul.find_all("li"):
-            if not file_li.find("ul"):
-                direct_texts = [
-                    t for t in file_li.contents if isinstance(t, str)
-                ]
-                fname_text = "".join(direct_texts).strip()
-                if fname_text:
-                    filenames.append(fname_text)
-    return filenames
-
-
-def _extract_filenames_from_torrent_page(torrent_soup):
-    """Extract filenames from a torrent page's file list."""
+def _scan_episode_filenames(torrent_soup):
+    """Find candidate episode filenames in a torrent page's file list with one regex pass.
+    Scans the file list text line by line instead of walking every <li>, keeping only
+    [One Pace] 1080p names that carry a CRC32 tag. Folder names and file sizes end up
+    on their own lines and are skipped.
+    Returns: Tuple of filenames in file-list order, or None if the page has no file list
+    (an error page or changed layout, as opposed to a file list without episode files)"""
     filelist_div = torrent_soup.find("div", class_="torrent-file-list")
     if not filelist_div:
-        return []
-    
-    has_folder = bool(filelist_div.find("a", class_="folder"))
-    
-    if has_folder:
-        return _extract_filenames_from_folder_structure(filelist_div)
-    else:
-        li = filelist_div.find("li")
-        if li:
-            direct_texts = [t for t in li.contents if isinstance(t, str)]
-            fname_text = "".join(direct_texts).strip()
-            if fname_text:
-                return [fname_text]
-    return []
+        return None
+    text = filelist_div.get_text("\n")
+    return tuple(m.group(0).strip() for m in EPISODE_FILENAME_LINE_REGEX.finditer(text))
+
 
+@functools.lru_cache(maxsize=TORRENT_PAGE_CACHE_SIZE)
+def _fetch_torrent_filenames(page_link):
+    """Fetch a torrent page and return the candidate episode filenames in its file list.
+    Memoized on page_link so a torrent listed several times is fetched and parsed once.
+    Failed fetches raise, so they are not cached and can be retried.
+    Returns: Tuple of filenames, or None if the page has no file list
+    Raises: requests.HTTPError if the page did not return HTTP 200"""
+    torrent_resp = _http_get(page_link)
+    if torrent_resp.status_code != HTTP_OK:
+        raise requests.HTTPError(f"status code {torrent_resp.status_code}", response=torrent_resp)
+    t_soup = _parse_torrent_page(torrent_resp.text)
+    return _scan_episode_filenames(t_soup)
 
-def _process_torrent_page(page_link, seen_crc32, episodes, magnet_link=""):
+
+def _process_torrent_page(page_link, seen_crc32, episodes, magnet_link="", no_crc_pages=None):
     """Process a torrent page to extract CRC32 information from file list.
-    For grouped episodes, all episodes in the group share the same magnet_link."""
+    For grouped episodes, all episodes in the group share the same magnet_link.
+    Pages whose file list was parsed but holds no episode file are added to no_crc_pages, if given;
+    pages without a file list at all are not, so they are fetched again next time."""
     try:
-        torrent_resp = requests.get(page_link)
-        if torrent_resp.status_code != HTTP_OK:
-            print(f"Failed to fetch torrent page {page_link}")
-            return False
-        t_soup = BeautifulSoup(torrent_resp.text, HTML_PARSER)
-        filenames = _extract_filenames_from_torrent_page(t_soup)
-        found = False
-        for fname in filenames:
-            if _process_fname_entry(str(fname), seen_crc32, episodes, page_link, magnet_link):
-                found = True
-        return found
+        filenames = _fetch_torrent_filenames(page_link)
+    except requests.HTTPError:
+        print(f"Failed to fetch torrent page {page_link}")
+        return False
     except (requests.RequestException, AttributeError, TypeError):
         return False
+    if filenames is None:
+        return False
+    if not filenames and no_crc_pages is not None:
+        no_crc_pages.add(page_link)
+    found = False
+    for fname in filenames:
+        if _process_fname_entry(fname, seen_crc32, episodes, page_link, magnet_link):
+            found = True
+    return found
 
 
-def _process_episode_row(row, seen_crc32, episodes):
-    """Process a single table row to extract episode information."""
+def _torrent_links_without_crc32(rows, only_valid_titles=False):
+    """Collect page links for rows whose title has no CRC32 (rows that need their torrent page).
+    Args:
+        rows: Listing table rows
+        only_valid_titles: If True, also skip rows without the One Pace marker or 1080p quality
+    Returns: List of unique page links in row order"""
+    page_links = []
+    for row in rows:
+        title_link, _ = _extract_links_from_row(row)
+        if not title_link:
+            continue
+        title = title_link.text
+        if CRC32_REGEX.search(title):
+            continue
+        if only_valid_titles and (ONE_PACE_MARKER not in title or not _is_valid_quality(title)):
+            continue
+        page_links.append(NYAA_BASE_URL + title_link["href"])
+    return list(dict.fromkeys(page_links))
+
+
+def _prefetch_torrent_page(page_link):
+    """Warm the torrent page cache for one link; errors are left for the row processing to report."""
+    if _shutdown_requested:
+        return
+    try:
+        _fetch_torrent_filenames(page_link)
+    except (requests.RequestException, AttributeError, TypeError):
+        pass
+
+
+def _prefetch_torrent_pages(page_links):
+    """Fetch torrent pages concurrently so the in-order row pass reads them from cache.
+    Only the fetch and parse run in worker threads; seen_crc32/episodes stay on the calling thread."""
+    if len(page_links) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=NYAA_MAX_WORKERS) as executor:
+        list(executor.map(_prefetch_torrent_page, page_links))
+
+
+def _process_episode_row(row, seen_crc32, episodes, no_crc_pages):
+    """Process a single table row to extract episode information.
+    Torrent pages in no_crc_pages are known to list no episode file and aren't fetched again."""
     title_link, magnet_link = _extract_links_from_row(row)
     if not title_link:
         return False
     
     title = title_link.text.strip()
     page_link = NYAA_BASE_URL + title_link["href"]
-    matches = CRC32_REGEX.findall(title)
     
-    if matches:
+    if CRC32_REGEX.search(title):
         return _process_fname_entry(title, seen_crc32, episodes, page_link, magnet_link or "")
-    else:
-        # CRC32 not in title, need to visit torrent page
-        # The magnet_link from the row applies to all episodes in the group
-        return _process_torrent_page(page_link, seen_crc32, episodes, magnet_link or "")
+    if page_link in no_crc_pages:
+        return False
+    # CRC32 not in title, need to visit torrent page
+    # The magnet_link from the row applies to all episodes in the group
+    return _process_torrent_page(page_link, seen_crc32, episodes, magnet_link or "", no_crc_pages)
+
+
+def _page_url(base_url, page):
+    """Build the URL of one search results page from a Nyaa search URL.
+    The query is re-encoded with p set to the page, replacing any p already in base_url
+    (and working when base_url has no query at all)."""
+    parts = urlsplit(base_url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "p"]
+    query.append(("p", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
 
 
-def _fetch_episodes_page(base_url, page, soup=None):
-    """Fetch a single page of episodes.
+def _fetch_listing_page(base_url, page):
+    """Fetch and parse a single Nyaa search results page.
+    Shared by the episodes, CRC32 and magnet link crawls; runs on worker threads, so
+    progress is printed by the callers as pages are processed in order.
     Returns tuple: (page_soup, success) where success indicates if page was fetched."""
-    if page == 1 and soup is not None:
-        return soup, True
-    
-    resp = requests.get(f"{base_url}&p={page}")
+    resp = _http_get(_page_url(base_url, page))
     if resp.status_code != HTTP_OK:
         print(f"Failed to fetch page {page}, status code: {resp.status_code}")
         return None, False
-    return BeautifulSoup(resp.text, HTML_PARSER), True
+    return _parse_listing_page(resp.text), True
 
 
-def _process_episodes_page_rows(page_soup, seen_crc32, episodes):
+def _iter_listing_pages(fetch_page, base_url, total_pages, first_page_soup):
+    """Fetch listing pages 2..total_pages concurrently and yield them in page order.
+    Page 1 is taken from first_page_soup (already fetched to read pagination).
+    Args:
+        fetch_page: Callable (base_url, page) -> (soup, success)
+        base_url: Nyaa search URL
+        total_pages: Number of pages to yield
+        first_page_soup: BeautifulSoup object for page 1
+    Yields: Tuples of (page, soup, success)"""
+    executor = ThreadPoolExecutor(max_workers=NYAA_MAX_WORKERS)
+    futures = {}
+    try:
+        for page in range(2, total_pages + 1):
+            futures[page] = executor.submit(fetch_page, base_url, page)
+        yield 1, first_page_soup, True
+        for page in range(2, total_pages + 1):
+            soup, success = futures[page].result()
+            yield page, soup, success
+    finally:
+        # Don't wait for (or start) fetches nobody will consume; cancelling each future
+        # instead of shutdown(cancel_futures=True) keeps this working on Python 3.8
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _process_episodes_page_rows(page_soup, seen_crc32, episodes, no_crc_pages):
     """Process all rows from an episodes page."""
     table = page_soup.find("table", class_="torrent-list")
     if not table:
         return
     rows = table.find_all("tr")  # type: ignore
+    _prefetch_torrent_pages(
+        [link for link in _torrent_links_without_crc32(rows) if link not in no_crc_pages]
+    )
     for row in rows:
         if _shutdown_requested:
             break
-        _process_episode_row(row, seen_crc32, episodes)
+        _process_episode_row(row, seen_crc32, episodes, no_crc_pages)
 
 
-def fetch_episodes_metadata(base_url=None):
+def fetch_episodes_metadata(base_url=None, no_crc_pages=None):
     """
     Fetch all One Pace episodes from Nyaa, collecting CRC32, title, page link, and magnet link.
     If CRC32 not in title, fetch the torrent page and try to extract CRC32s from file list.
@@ -390,41 +715,42 @@ def fetch_episodes_metadata(base_url=None):
     Args:
         base_url: Base URL for Nyaa search. If None, uses default without quality filter.
                   Note: Quality filtering (1080p only) is always applied regardless of URL.
+        no_crc_pages: Optional set of torrent page links known to list no episode file; those
+                      pages are skipped, and pages found to list none are added to the set.
     Returns: List of (crc32, title, page_link, magnet_link)
     """
     if base_url is None:
         base_url = f"{NYAA_BASE_URL}/?f=0&c=0_0&q=one+pace"
+    if no_crc_pages is None:
+        no_crc_pages = set()
     
     episodes = []
     seen_crc32 = set()
     print(f"Browsing {base_url}...")
 
     # Get total number of pages by parsing first page's pagination controls
-    soup, success = _fetch_episodes_page(base_url, 1)
+    soup, success = _fetch_listing_page(base_url, 1)
     if not success:
         debug_print("DEBUG: Failed to fetch first page for episodes metadata")
         return episodes
     total_pages = _get_total_pages(soup)
     debug_print(f"DEBUG: Found {total_pages} total pages to process for episodes metadata")
 
-    # Loop from page 1 to total_pages
-    page = 1
-    while page <= total_pages:
-        if _shutdown_requested:
-            print(_SHUTDOWN_MESSAGE)
-            break
-            
-        print(f"Fetching page {page}/{total_pages}...")
-        page_soup, success = _fetch_episodes_page(base_url, page, soup if page == 1 else None)
-        if not success:
-            break
-        
-        _process_episodes_page_rows(page_soup, seen_crc32, episodes)
-        
-        if _shutdown_requested:
-            break
-        page += 1
-        time.sleep(REQUEST_DELAY_SECONDS)
+    # Pages 2..total_pages are fetched concurrently but processed in order
+    with closing(_iter_listing_pages(_fetch_listing_page, base_url, total_pages, soup)) as pages:
+        for page, page_soup, success in pages:
+            if _shutdown_requested:
+                print(_SHUTDOWN_MESSAGE)
+                break
+
+            print(f"Fetching page {page}/{total_pages}...")
+            if not success:
+                break
+
+            _process_episodes_page_rows(page_soup, seen_crc32, episodes, no_crc_pages)
+
+            if _shutdown_requested:
+                break
     
     print(f"Fetched {len(episodes)} unique episodes with CRC32s.")
     return episodes
@@ -457,6 +783,15 @@ def _should_skip_episodes_update(force_update, last_update_str):
     return False
 
 
+def _load_no_crc_pages(conn):
+    """Load the torrent page links known to list no One Pace 1080p file with a CRC32.
+    Torrent contents never change, so these pages needn't be fetched again.
+    Returns: Set of page links"""
+    c = conn.cursor()
+    c.execute("SELECT page_link FROM no_crc_pages")
+    return {page_link for (page_link,) in c.fetchall()}
+
+
 def update_episodes_index_db(base_url=None, force_update=False):
     """Update episodes index database from Nyaa.
     Args:
@@ -473,9 +808,15 @@ def update_episodes_index_db(base_url=None, force_update=False):
         if _should_skip_episodes_update(force_update, last_update_str):
             conn.close()
             return
-    episodes = fetch_episodes_metadata(base_url)
+    known_no_crc_pages = _load_no_crc_pages(conn)
+    no_crc_pages = set(known_no_crc_pages)
+    episodes = fetch_episodes_metadata(base_url, no_crc_pages=no_crc_pages)
     debug_print(f"DEBUG: Fetched {len(episodes)} episodes from Nyaa")
     c = conn.cursor()
+    c.executemany(
+        "INSERT OR IGNORE INTO no_crc_pages (page_link) VALUES (?)",
+        [(page_link,) for page_link in no_crc_pages - known_no_crc_pages]
+    )
     
     # Prepare data for batch insert (allowing for shutdown during processing)
     episode_rows = []
@@ -492,13 +833,12 @@ def update_episodes_index_db(base_url=None, force_update=False):
             crc32, title, page_link, magnet_link = episode_data
         episode_rows.append((crc32, title, page_link, magnet_link or ""))
     
-    # Batch insert for better performance
+    # Batch insert for better performance; set_episodes_metadata commits rows and timestamp together
     if episode_rows:
         c.executemany(
             "INSERT OR REPLACE INTO episodes_index (crc32, title, page_link, magnet_link) VALUES (?, ?, ?, ?)",
             episode_rows
         )
-    conn.commit()
     count = len(episode_rows)
     now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     set_episodes_metadata(conn, "episodes_db_last_update", now_str)
@@ -508,21 +848,27 @@ def update_episodes_index_db(base_url=None, force_update=False):
     conn.close()
 
 
-def load_crc32_to_title_from_index():
+def load_crc32_to_title_from_index(conn=None):
     """Load CRC32 to title mapping from episodes index database.
+    Args:
+        conn: Optional open episodes index connection to reuse (left open); opens its own otherwise
     Returns: Dictionary mapping CRC32 to episode title."""
-    conn = init_episodes_db()
+    if conn is None:
+        with closing(init_episodes_db()) as own_conn:
+            return load_crc32_to_title_from_index(own_conn)
     c = conn.cursor()
     c.execute("SELECT crc32, title FROM episodes_index")
-    d = dict(c.fetchall())
-    conn.close()
-    return d
+    return dict(c.fetchall())
 
 
-def load_1080p_episodes_from_index():
+def load_1080p_episodes_from_index(conn=None):
     """Load only 1080p episodes from episodes_index database.
+    Args:
+        conn: Optional open episodes index connection to reuse (left open); opens its own otherwise
     Returns: Tuple of (crc32_to_link, crc32_to_text, crc32_to_magnet) dictionaries with only 1080p episodes."""
-    conn = init_episodes_db()
+    if conn is None:
+        with closing(init_episodes_db()) as own_conn:
+            return load_1080p_episodes_from_index(own_conn)
     c = conn.cursor()
     # Handle both old schema (without magnet_link) and new schema (with magnet_link)
     try:
@@ -546,7 +892,6 @@ def load_1080p_episodes_from_index():
             crc32_to_link[crc32] = page_link
             crc32_to_text[crc32] = title
             crc32_to_magnet[crc32] = magnet_link or ""
-    conn.close()
     return crc32_to_link, crc32_to_text, crc32_to_magnet
 
 
@@ -566,10 +911,16 @@ def _is_valid_one_pace_episode(filename_text):
 
 
 def _extract_crc32_from_text(text):
-    """Extract CRC32 from text if present."""
-    matches = CRC32_REGEX.findall(text)
-    if matches:
-        return matches[-1].upper()
+    """Extract the last CRC32 tag from text if present.
+    Searches the tail of the text first, where the tag almost always is; any tag found
+    there is the last one. Falls back to the whole text otherwise.
+    Returns: Uppercase CRC32 string or None"""
+    tail_start = len(text) - CRC32_TAIL_LENGTH
+    match = LAST_CRC32_REGEX.search(text, tail_start) if tail_start > 0 else None
+    if not match:
+        match = LAST_CRC32_REGEX.search(text)
+    if match:
+        return match.group(1).upper()
     return None
 
 
@@ -584,21 +935,15 @@ def _check_crc32_in_title(filename_text, crc32_set, magnet_link):
 def _fetch_crc32_from_torrent_page(link, crc32_set, magnet_link):
     """Fetch torrent page and extract CRC32 from file list."""
     try:
-        torrent_resp = requests.get(link)
-        if torrent_resp.status_code != HTTP_OK:
-            return None, None
-        
-        t_soup = BeautifulSoup(torrent_resp.text, HTML_PARSER)
-        filenames = _extract_filenames_from_torrent_page(t_soup)
-        for fname in filenames:
-            fname_str = str(fname)
-            if ONE_PACE_MARKER in fname_str and _is_valid_quality(fname_str):
-                crc32 = _extract_crc32_from_text(fname_str)
-                if crc32 and crc32 in crc32_set:
-                    return crc32, magnet_link
+        filenames = _fetch_torrent_filenames(link)
     except (requests.RequestException, AttributeError, TypeError):
-        pass
-    
+        return None, None
+
+    for fname_str in filenames or ():
+        if ONE_PACE_MARKER in fname_str and _is_valid_quality(fname_str):
+            crc32 = _extract_crc32_from_text(fname_str)
+            if crc32 and crc32 in crc32_set:
+                return crc32, magnet_link
     return None, None
 
 
@@ -643,6 +988,7 @@ def _process_magnet_links_page(page_soup, crc32_set, crc32_to_magnet):
         return found_count
     
     rows = table.find_all("tr")
+    _prefetch_torrent_pages(_torrent_links_without_crc32(rows, only_valid_titles=True))
     for row in rows:
         if _shutdown_requested:
             break
@@ -654,18 +1000,6 @@ def _process_magnet_links_page(page_soup, crc32_set, crc32_to_magnet):
     return found_count
 
 
-def _get_page_soup_for_magnet_links(base_url, page, first_page_soup):
-    """Get BeautifulSoup object for a specific page when fetching magnet links.
-    Args:
-        base_url: Nyaa search URL
-        page: Page number (1-indexed)
-        first_page_soup: BeautifulSoup object for page 1 (already fetched)
-    Returns: Tuple of (soup, success)"""
-    if page == 1:
-        return first_page_soup, True
-    return _fetch_crc32_page(base_url, page)
-
-
 def fetch_magnet_links_for_episodes_from_search(base_url, crc32_to_link):
     """Fetch magnet links from Nyaa search results for episodes already in crc32_to_link.
     This is more efficient than fetching all episodes again.
@@ -679,35 +1013,23 @@ def fetch_magnet_links_for_episodes_from_search(base_url, crc32_to_link):
     if not crc32_set:
         return crc32_to_magnet
     
-    # Get total number of pages (fetch page 1 silently first to get total pages)
-    resp = requests.get(f"{base_url}&p=1")
-    if resp.status_code != HTTP_OK:
+    # Get total number of pages from page 1's pagination controls
+    soup, success = _fetch_listing_page(base_url, 1)
+    if not success:
         return crc32_to_magnet
-    soup = BeautifulSoup(resp.text, HTML_PARSER)
     total_pages = _get_total_pages(soup)
     print(f"Fetching magnet links from {total_pages} pages...")
     
     # Process pages to extract magnet links for episodes we need
-    # Continue searching until we've found all requested episodes or searched all pages
-    page = 1
-    while page <= total_pages and len(crc32_to_magnet) < len(crc32_set):
-        if _shutdown_requested:
-            break
-        
-        if page == 1:
-            page_soup = soup
-            success = True
-        else:
-            page_soup, success = _get_page_soup_for_magnet_links(base_url, page, soup)
-        
-        if not success or page_soup is None:
-            break
-        
-        _process_magnet_links_page(page_soup, crc32_set, crc32_to_magnet)
-        
-        page += 1
-        if page <= total_pages:
-            time.sleep(REQUEST_DELAY_SECONDS)
+    # Continue searching until we've found all requested episodes or searched all pages;
+    # pages 2..total_pages are fetched concurrently and pending fetches are cancelled on early exit
+    with closing(_iter_listing_pages(_fetch_listing_page, base_url, total_pages, soup)) as pages:
+        for _, page_soup, success in pages:
+            if _shutdown_requested or len(crc32_to_magnet) >= len(crc32_set):
+                break
+            if not success or page_soup is None:
+                break
+            _process_magnet_links_page(page_soup, crc32_set, crc32_to_magnet)
     
     return crc32_to_magnet
 
@@ -757,9 +1079,8 @@ def _extract_links_from_row(row):
 def _process_title_with_crc32(filename_text, link, magnet_link, crc32_to_link, crc32_to_text, crc32_to_magnet):
     """Process a title that has CRC32 in it.
     Returns True if successfully processed, False otherwise."""
-    matches = CRC32_REGEX.findall(filename_text)
-    if matches:
-        crc32 = matches[-1].upper()
+    crc32 = _extract_crc32_from_text(filename_text)
+    if crc32:
         crc32_to_link[crc32] = link
         crc32_to_text[crc32] = filename_text
         crc32_to_magnet[crc32] = magnet_link
@@ -771,22 +1092,17 @@ def _process_torrent_page_for_crc32(link, magnet_link, crc32_to_link, crc32_to_t
     """Fetch torrent page and extract CRC32 from file list.
     Returns True if CRC32 found, False otherwise."""
     try:
-        torrent_resp = requests.get(link)
-        if torrent_resp.status_code == HTTP_OK:
-            t_soup = BeautifulSoup(torrent_resp.text, HTML_PARSER)
-            filenames = _extract_filenames_from_torrent_page(t_soup)
-            for fname in filenames:
-                fname_str = str(fname)
-                if ONE_PACE_MARKER in fname_str and _is_valid_quality(fname_str):
-                    fname_matches = CRC32_REGEX.findall(fname_str)
-                    if fname_matches:
-                        crc32 = fname_matches[-1].upper()
-                        crc32_to_link[crc32] = link
-                        crc32_to_text[crc32] = fname_str
-                        crc32_to_magnet[crc32] = magnet_link
-                        return True
+        filenames = _fetch_torrent_filenames(link)
     except (requests.RequestException, AttributeError, TypeError):
-        pass
+        return False
+    for fname_str in filenames or ():
+        if ONE_PACE_MARKER in fname_str and _is_valid_quality(fname_str):
+            crc32 = _extract_crc32_from_text(fname_str)
+            if crc32:
+                crc32_to_link[crc32] = link
+                crc32_to_text[crc32] = fname_str
+                crc32_to_magnet[crc32] = magnet_link
+                return True
     return False
 
 
@@ -823,17 +1139,6 @@ def _process_crc32_row(row, crc32_to_link, crc32_to_text, crc32_to_magnet):
     return False, filename_text, True
 
 
-def _fetch_crc32_page(base_url, page):
-    """Fetch a single page for CRC32 links.
-    Returns tuple: (soup, success) where success indicates if page was fetched."""
-    print(f"Fetching page {page}...")
-    resp = requests.get(f"{base_url}&p={page}")
-    if resp.status_code != HTTP_OK:
-        print(f"Failed to fetch page {page}, status code: {resp.status_code}")
-        return None, False
-    return BeautifulSoup(resp.text, HTML_PARSER), True
-
-
 def _process_crc32_page_rows(soup, crc32_to_link, crc32_to_text, crc32_to_magnet):
     """Process all rows from a CRC32 links page.
     Returns the number of episodes found on this page."""
@@ -845,6 +1150,7 @@ def _process_crc32_page_rows(soup, crc32_to_link, crc32_to_text, crc32_to_magnet
     if not rows:
         return 0
 
+    _prefetch_torrent_pages(_torrent_links_without_crc32(rows, only_valid_titles=True))
     found_count = 0
     for row in rows:
         if _shutdown_requested:
@@ -873,7 +1179,7 @@ def fetch_crc32_links(base_url):
     debug_print(f"DEBUG: Starting fetch_crc32_links with URL: {base_url}")
     
     # Get total number of pages by parsing first page's pagination controls
-    soup, success = _fetch_crc32_page(base_url, 1)
+    soup, success = _fetch_listing_page(base_url, 1)
     if not success:
         debug_print("DEBUG: Failed to fetch first page for CRC32 links")
         return crc32_to_link, crc32_to_text, crc32_to_magnet, 0
@@ -882,33 +1188,24 @@ def fetch_crc32_links(base_url):
     debug_print(f"DEBUG: Found {total_pages} total pages to process for CRC32 links")
     last_checked_page = 0
     
-    # Loop from page 1 to total_pages (similar to fetch_episodes_metadata)
-    page = 1
-    while page <= total_pages:
-        if _shutdown_requested:
-            print(_SHUTDOWN_MESSAGE)
-            break
-        
-        # Use cached soup for page 1, fetch for others
-        if page == 1:
-            page_soup = soup
-            success = True
-        else:
-            page_soup, success = _fetch_crc32_page(base_url, page)
-        
-        if not success:
-            break
-        
-        episodes_found = _process_crc32_page_rows(page_soup, crc32_to_link, crc32_to_text, crc32_to_magnet)
-        debug_print(f"DEBUG: Page {page}/{total_pages}: Found {episodes_found} valid episodes (total so far: {len(crc32_to_link)})")
-        
-        if _shutdown_requested:
-            break
-        
-        last_checked_page = page
-        page += 1
-        if page <= total_pages:  # Don't sleep after last page
-            time.sleep(REQUEST_DELAY_SECONDS)
+    # Pages 2..total_pages are fetched concurrently but processed in order
+    with closing(_iter_listing_pages(_fetch_listing_page, base_url, total_pages, soup)) as pages:
+        for page, page_soup, success in pages:
+            if _shutdown_requested:
+                print(_SHUTDOWN_MESSAGE)
+                break
+
+            print(f"Fetching page {page}/{total_pages}...")
+            if not success:
+                break
+
+            episodes_found = _process_crc32_page_rows(page_soup, crc32_to_link, crc32_to_text, crc32_to_magnet)
+            debug_print(f"DEBUG: Page {page}/{total_pages}: Found {episodes_found} valid episodes (total so far: {len(crc32_to_link)})")
+
+            if _shutdown_requested:
+                break
+
+            last_checked_page = page
     
     debug_print(f"DEBUG: Completed fetch_crc32_links: {len(crc32_to_link)} total episodes found across {last_checked_page} pages")
 
@@ -924,8 +1221,7 @@ def _extract_matching_titles_from_rows(rows, crc32):
             href = a.get("href", "")
             if href.startswith("/view/") and a.has_attr("title"):
                 filename_text = a.text
-                matches = CRC32_REGEX.findall(filename_text)
-                if matches and matches[-1].upper() == crc32:
+                if _extract_crc32_from_text(filename_text) == crc32:
                     matched_titles.append(filename_text)
     return matched_titles
 
@@ -937,11 +1233,11 @@ def fetch_title_by_crc32(crc32):
     Returns: Episode title if exactly one match found, None otherwise."""
     # Search on Nyaa for the given CRC32
     search_url = f"{NYAA_BASE_URL}/?f=0&c=0_0&q={crc32}&o=asc"
-    resp = requests.get(search_url)
+    resp = _http_get(search_url)
     if resp.status_code != HTTP_OK:
         print(f"Failed to fetch search results for CRC32 {crc32}")
         return None
-    soup = BeautifulSoup(resp.text, HTML_PARSER)
+    soup = _parse_listing_page(resp.text)
     table = soup.find("table", class_="torrent-list")
     if not table:
         return None
@@ -959,91 +1255,322 @@ def fetch_title_by_crc32(crc32):
         return None
 
 
+def _prefetch_mapping(mapped, offset):
+    """Ask the kernel to start reading the slice at offset of a memory-mapped file in the background.
+    No-op past the end of the mapping or where madvise/MADV_WILLNEED isn't available."""
+    if offset >= len(mapped) or not hasattr(mmap, "MADV_WILLNEED"):
+        return
+    try:
+        mapped.madvise(mmap.MADV_WILLNEED, offset, CRC32_CHUNK_SIZE)
+    except (AttributeError, OSError):
+        pass
+
+
+def _crc32_from_mapping(mapped):
+    """Calculate CRC32 over a memory-mapped file in CRC32_CHUNK_SIZE slices.
+    Slicing a memoryview of the mapping passes page-cache memory to zlib without copying.
+    The next slice is prefetched before each one is hashed, so disk reads overlap the CRC.
+    Returns the CRC32 as an int, or None if calculation was interrupted."""
+    crc = 0
+    with memoryview(mapped) as view:
+        for offset in range(0, len(view), CRC32_CHUNK_SIZE):
+            if _shutdown_requested:
+                return None
+            _prefetch_mapping(mapped, offset + CRC32_CHUNK_SIZE)
+            # Must stay CRC-32 (IEEE) as used in release tags; CRC-32C libraries use
+            # another polynomial and give different values
+            crc = _crc32(view[offset:offset + CRC32_CHUNK_SIZE], crc)
+    return crc
+
+
+def _fadvise(f, advice_name, length=0):
+    """Give the kernel a posix_fadvise hint, named as in the os module, for the first
+    length bytes of a file (0 means the whole file).
+    No-op where posix_fadvise isn't available (e.g. Windows, macOS)."""
+    advice = getattr(os, advice_name, None)
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, length, advice)
+    except OSError:
+        pass
+
+
+def _crc32_from_stream(f):
+    """Calculate CRC32 by reading an open file into a single reusable buffer.
+    Used when the file can't be memory-mapped.
+    Returns the CRC32 as an int, or None if calculation was interrupted."""
+    _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+    buf = bytearray(CRC32_CHUNK_SIZE)
+    view = memoryview(buf)
+    crc = 0
+    while n := f.readinto(buf):
+        if _shutdown_requested:
+            return None
+        crc = _crc32(view[:n], crc)
+    return crc
+
+
+def _prefetch_file_start(file_path):
+    """Ask the kernel to start reading the first chunk of a file that will be hashed soon.
+    Hides the first-touch read latency between files; the rest of the file is prefetched
+    slice by slice while it is hashed. Errors are ignored, the file is just read later."""
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            _fadvise(f, "POSIX_FADV_WILLNEED", CRC32_CHUNK_SIZE)
+    except OSError:
+        pass
+
+
+def _crc32_from_large_file(f):
+    """Calculate CRC32 of an open file by memory-mapping it, or by buffered reads if it can't be mapped.
+    Returns the CRC32 as an int, or None if calculation was interrupted."""
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return _crc32_from_stream(f)
+    with mapped:
+        try:
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        except (AttributeError, OSError):
+            pass  # Only a readahead hint; hashing works without it
+        return _crc32_from_mapping(mapped)
+
+
 def _calculate_file_crc32(file_path):
     """Calculate CRC32 for a single file.
+    Files of at most one chunk are read and hashed in a single call. Larger files are
+    memory-mapped so the CRC is computed straight from the page cache, falling back to
+    buffered reads on filesystems that don't support mmap.
     Returns the CRC32 as a string, or None if calculation was interrupted."""
-    with open(file_path, "rb") as f:
-        crc = 0
-        while chunk := f.read(CRC32_CHUNK_SIZE):
-            if _shutdown_requested:
-                return None
-            crc = zlib.crc32(chunk, crc)
-        return f"{crc & 0xFFFFFFFF:08X}"
+    with open(file_path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size <= CRC32_CHUNK_SIZE:
+            crc = None if _shutdown_requested else _crc32(f.readall())
+        else:
+            crc = _crc32_from_large_file(f)
+    if crc is None:
+        return None
+    # zlib.crc32 (and isal's drop-in) already return an unsigned 32-bit value
+    return "%08X" % crc
 
 
-def _process_video_file(file_path, c, conn, local_crc32s):
-    """Process a single video file: check cache or calculate CRC32.
-    Returns True if file was processed successfully."""
-    normalized_path = normalize_file_path(file_path)
-    
-    # Check if already in DB
-    c.execute("SELECT crc32 FROM crc32_cache WHERE file_path = ?", (normalized_path,))
-    row = c.fetchone()
-    if row:
-        local_crc32s.add(row[0])
-        debug_print(f"DEBUG: Using cached CRC32 for {os.path.basename(file_path)}: {row[0]}")
-        return True
-    
-    # Calculate CRC32
+def _load_cache_entries(conn):
+    """Load the whole CRC32 cache in one query.
+    Returns: Dictionary mapping normalized file path to (crc32, size, mtime).
+    size and mtime are None for rows cached before they were recorded."""
+    c = conn.cursor()
+    c.execute("SELECT file_path, crc32, size, mtime FROM crc32_cache")
+    return {file_path: (crc32, size, mtime) for file_path, crc32, size, mtime in c.fetchall()}
+
+
+def _normalized_entry_path(entry, normalized_dir):
+    """Normalized path of a directory entry, given its parent's normalized path.
+    Only symlinks need normalize_file_path; anything else resolves to its name joined
+    to the already-resolved parent, which saves a realpath walk per file."""
+    if entry.is_symlink():
+        return normalize_file_path(entry.path)
+    return os.path.join(normalized_dir, entry.name)
+
+
+def _scan_video_files(folder):
+    """Recursively list video files under folder in a single pass.
+    Uses os.scandir so directory entries carry their type without extra stat calls.
+    Like os.walk, symlinked directories are not followed and unreadable directories are skipped.
+    Returns list of (file_path, normalized_path) tuples."""
+    video_files = []
+    pending_dirs = [(folder, normalize_file_path(folder))]
+    while pending_dirs:
+        if _shutdown_requested:
+            print("Shutdown requested, stopping file processing...")
+            break
+        dir_path, normalized_dir = pending_dirs.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            pending_dirs.append((entry.path, os.path.join(normalized_dir, entry.name)))
+                    elif entry.name[-VIDEO_SUFFIX_MAX_LENGTH:].lower().endswith(VIDEO_SUFFIXES):
+                        video_files.append((entry.path, _normalized_entry_path(entry, normalized_dir)))
+        except OSError:
+            continue
+    return video_files
+
+
+def _cached_crc32_if_current(cache_entry, size, mtime):
+    """Return the cached CRC32 if the file's size and mtime still match the cache entry.
+    Entries cached before size/mtime were recorded are trusted, as they were before.
+    Returns: CRC32 string, or None if the file must be (re)hashed"""
+    if not cache_entry or not cache_entry[0]:
+        return None
+    crc32, cached_size, cached_mtime = cache_entry
+    if cached_size is None or (cached_size == size and cached_mtime == mtime):
+        return crc32
+    return None
+
+
+def _index_cache_by_file_identity(cache_entries):
+    """Map (size, mtime) to a cached file so files moved or renamed outside Ace-Pace are recognized.
+    Legacy entries without size/mtime are left out, and a (size, mtime) pair shared by several
+    cached files maps to None so it is never guessed.
+    Returns: Dictionary mapping (size, mtime) to (crc32, file_path) or None"""
+    by_identity = {}
+    for file_path, (crc32, size, mtime) in cache_entries.items():
+        if size is not None:
+            key = (size, mtime)
+            by_identity[key] = None if key in by_identity else (crc32, file_path)
+    return by_identity
+
+
+def _lookup_cached_crc32(cache_entry, cached_by_identity, st):
+    """Find a reusable CRC32 for a scanned file from its own cache entry, or else by (size, mtime).
+    Returns: Tuple of (crc32, moved_from_path); crc32 is None if the file must be hashed and
+    moved_from_path is the cached path the CRC32 was taken from when matched by identity"""
+    if cache_entry:
+        return _cached_crc32_if_current(cache_entry, st.st_size, st.st_mtime), None
+    return cached_by_identity.get((st.st_size, st.st_mtime)) or (None, None)
+
+
+def _collect_files_to_hash(video_files, cache_entries, local_crc32s, stats, backfill_rows, moved_from_paths):
+    """Split video files into cached CRC32s (added to local_crc32s) and files that still need hashing.
+    A cached CRC32 is only reused if the file's size and mtime are unchanged; legacy entries
+    without them are reused and queued in backfill_rows so they get recorded. A path missing
+    from the cache reuses the CRC32 of a cached file with the same size and mtime (a file moved
+    or renamed outside Ace-Pace), also queued in backfill_rows under its new path; the cached
+    path it came from is added to moved_from_paths so its row can be dropped.
+    Returns list of (file_path, normalized_path, size, mtime) tuples to hash."""
+    files_to_hash = []
+    cached_by_identity = _index_cache_by_file_identity(cache_entries)
+    for file_path, normalized_path in video_files:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue  # File disappeared since the scan
+        cache_entry = cache_entries.get(normalized_path)
+        crc32, moved_from = _lookup_cached_crc32(cache_entry, cached_by_identity, st)
+        if crc32:
+            local_crc32s.add(crc32)
+            stats['processed'] += 1
+            stats['cached'] += 1
+            if not cache_entry or cache_entry[1] is None:
+                backfill_rows.append((normalized_path, crc32, st.st_size, st.st_mtime))
+            if moved_from:
+                moved_from_paths.append(moved_from)
+            debug_print(f"DEBUG: Using cached CRC32 for {os.path.basename(file_path)}: {crc32}")
+        else:
+            if cache_entry:
+                debug_print(f"DEBUG: {os.path.basename(file_path)} changed since it was cached, recalculating")
+            files_to_hash.append((file_path, normalized_path, st.st_size, st.st_mtime))
+    return files_to_hash
+
+
+def _drop_moved_cache_rows(c, conn, moved_from_paths):
+    """Delete the old cache rows of files matched by (size, mtime) under a new path, in one transaction.
+    Keeps files moved or renamed outside Ace-Pace from lingering under their old path
+    (in the rename plan and the CSV export) next to the row for their new path.
+    A path that still exists (a copy rather than a move) keeps its row."""
+    moved_paths = [(file_path,) for file_path in moved_from_paths if not os.path.exists(file_path)]
+    if not moved_paths:
+        return
+    c.executemany("DELETE FROM crc32_cache WHERE file_path = ?", moved_paths)
+    _bump_crc32_cache_version(c)
+    conn.commit()
+    debug_print(f"DEBUG: Removed {len(moved_paths)} cached paths of files moved since they were hashed")
+
+
+def _hash_video_file(file_path, lookahead_path=None):
+    """Calculate CRC32 for a video file, logging progress (runs in a worker thread).
+    lookahead_path, if given, is a file hashed later whose first chunk is prefetched first.
+    Returns the CRC32 as a string, or None if shutdown was requested."""
+    if _shutdown_requested:
+        return None
+    if lookahead_path:
+        _prefetch_file_start(lookahead_path)
     parent_folder = os.path.basename(os.path.dirname(file_path))
     file_name = os.path.basename(file_path)
     print(f"Calculating CRC32 for {parent_folder}/{file_name}...")
-    
-    crc32 = _calculate_file_crc32(file_path)
-    if crc32 is None:
-        debug_print(f"DEBUG: CRC32 calculation interrupted for {file_path}")
-        return False  # Calculation interrupted
-    
-    debug_print(f"DEBUG: Calculated CRC32 for {file_name}: {crc32}")
-    local_crc32s.add(crc32)
+    return _calculate_file_crc32(file_path)
+
+
+def _bump_crc32_cache_version(c):
+    """Record that crc32_cache changed, in the caller's transaction.
+    export_db_to_csv compares this counter with the one saved at the last export."""
     c.execute(
-        "INSERT OR REPLACE INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
-        (normalized_path, crc32),
+        "INSERT INTO metadata (key, value) VALUES ('crc32_cache_version', 1) "
+        "ON CONFLICT(key) DO UPDATE SET value = value + 1"
     )
-    conn.commit()
-    return True
 
 
-def _process_single_file_for_crc32(file_path, c, conn, local_crc32s):
-    """Process a single file for CRC32 calculation.
-    Returns tuple: (success: bool, was_cached: bool)"""
-    normalized_path = normalize_file_path(file_path)
-    # Check if already in DB
-    c.execute("SELECT crc32 FROM crc32_cache WHERE file_path = ?", (normalized_path,))
-    row = c.fetchone()
-    was_cached = bool(row)
-    
-    if _process_video_file(file_path, c, conn, local_crc32s):
-        return True, was_cached
-    return False, was_cached
+def _store_crc32_rows(c, conn, rows):
+    """Write pending (normalized_path, crc32, size, mtime) rows to the cache in one transaction.
+    Clears rows once written."""
+    if not rows:
+        return
+    c.executemany(
+        "INSERT OR REPLACE INTO crc32_cache (file_path, crc32, size, mtime) VALUES (?, ?, ?, ?)",
+        rows,
+    )
+    _bump_crc32_cache_version(c)
+    conn.commit()
+    rows.clear()
 
 
-def _process_files_in_directory(root, files, c, conn, local_crc32s, stats):
-    """Process files in a directory, updating stats.
-    Returns True if processing should continue, False if shutdown requested."""
-    for file in files:
-        if _shutdown_requested:
-            return False
-        
-        ext = os.path.splitext(file)[1].lower()
-        if ext in VIDEO_EXTENSIONS:
-            file_path = os.path.join(root, file)
-            success, was_cached = _process_single_file_for_crc32(file_path, c, conn, local_crc32s)
-            if success:
+def _hashed_crc32(future, file_path):
+    """Get the CRC32 from a _hash_video_file future.
+    A file that can't be read is reported and skipped, so the rest of the batch is still hashed and cached.
+    Returns: CRC32 string, or None if hashing was interrupted or the file couldn't be read"""
+    try:
+        crc32 = future.result()
+    except OSError as e:
+        print(f"Failed to calculate CRC32 for {file_path}: {e}")
+        return None
+    if crc32 is None:
+        debug_print(f"DEBUG: CRC32 calculation interrupted for {file_path}")
+    return crc32
+
+
+def _hash_files_concurrently(files_to_hash, c, conn, local_crc32s, stats):
+    """Hash files across CRC32_MAX_WORKERS threads and store results in the cache.
+    zlib.crc32 releases the GIL on large buffers, so threads hash files in parallel.
+    Each file starts by prefetching the one CRC32_MAX_WORKERS places later, which is the
+    file its worker picks up next, so that read is already under way when hashing moves on.
+    Database writes stay on the calling thread (sqlite3 connections are not shared)
+    and are committed every CRC32_CACHE_BATCH_SIZE files, plus once at the end.
+    Files that can't be read are skipped (see _hashed_crc32)."""
+    pending_rows = []
+    lookahead_paths = [file_to_hash[0] for file_to_hash in files_to_hash[CRC32_MAX_WORKERS:]]
+    with ThreadPoolExecutor(max_workers=CRC32_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_hash_video_file, file_to_hash[0], lookahead_path): file_to_hash
+            for file_to_hash, lookahead_path in zip_longest(files_to_hash, lookahead_paths)
+        }
+        try:
+            for future in as_completed(futures):
+                file_path, normalized_path, size, mtime = futures[future]
+                crc32 = _hashed_crc32(future, file_path)
+                if crc32 is None:
+                    continue
+                debug_print(f"DEBUG: Calculated CRC32 for {os.path.basename(file_path)}: {crc32}")
+                local_crc32s.add(crc32)
+                pending_rows.append((normalized_path, crc32, size, mtime))
                 stats['processed'] += 1
-                if was_cached:
-                    stats['cached'] += 1
-                else:
-                    stats['calculated'] += 1
-    return True
+                stats['calculated'] += 1
+                if len(pending_rows) >= CRC32_CACHE_BATCH_SIZE:
+                    _store_crc32_rows(c, conn, pending_rows)
+        finally:
+            # Keep already-hashed files even if a later file fails or we're shutting down
+            _store_crc32_rows(c, conn, pending_rows)
 
 
-def calculate_local_crc32(folder, conn):
+def calculate_local_crc32(folder, conn, video_files=None):
     """Calculate CRC32 checksums for all video files in the given folder.
-    Uses cached values from database when available.
+    Uses cached values from database when the file's size and mtime are unchanged;
+    new or changed files are hashed concurrently. A file found under a new path with the
+    size and mtime of a cached file takes over that file's row.
     Args:
         folder: Folder path to scan for video files
         conn: Database connection
+        video_files: Optional result of _scan_video_files(folder), to avoid scanning again
     Returns: Set of CRC32 checksums found in the folder."""
     local_crc32s = set()
     c = conn.cursor()
@@ -1051,13 +1578,19 @@ def calculate_local_crc32(folder, conn):
     
     debug_print(f"DEBUG: Starting calculate_local_crc32 for folder: {folder}")
     
-    for root, dirs, files in os.walk(folder):
-        if _shutdown_requested:
-            print("Shutdown requested, stopping file processing...")
-            break
-        
-        if not _process_files_in_directory(root, files, c, conn, local_crc32s, stats):
-            break
+    if video_files is None:
+        video_files = _scan_video_files(folder)
+    cache_entries = _load_cache_entries(conn)
+    backfill_rows = []
+    moved_from_paths = []
+    files_to_hash = _collect_files_to_hash(
+        video_files, cache_entries, local_crc32s, stats, backfill_rows, moved_from_paths
+    )
+    if backfill_rows:
+        _store_crc32_rows(c, conn, backfill_rows)
+    _drop_moved_cache_rows(c, conn, moved_from_paths)
+    if files_to_hash and not _shutdown_requested:
+        _hash_files_concurrently(files_to_hash, c, conn, local_crc32s, stats)
     
     debug_print(f"DEBUG: Processed {stats['processed']} video files ({stats['cached']} from cache, {stats['calculated']} calculated)")
     debug_print(f"DEBUG: Found {len(local_crc32s)} unique CRC32s")
@@ -1065,19 +1598,41 @@ def calculate_local_crc32(folder, conn):
     return local_crc32s
 
 
-def _build_rename_plan(entries, crc32_to_title):
-    """Build a plan of files to rename based on CRC32 matches."""
+def _load_rename_matches(conn):
+    """Join local CRC32s with episode titles inside SQLite.
+    Attaches the episodes index to the local connection so the join runs in SQLite
+    instead of loading the whole index into a Python dict.
+    Args:
+        conn: Database connection to crc32_files.db
+    Returns: List of (file_path, title) tuples for files whose CRC32 is in the episodes index"""
+    # Make sure the episodes index exists with its current schema before attaching it
+    init_episodes_db().close()
+    c = conn.cursor()
+    c.execute("ATTACH DATABASE ? AS episodes", (get_config_path(EPISODES_DB_NAME),))
+    try:
+        c.execute(
+            "SELECT c.file_path, e.title FROM crc32_cache c "
+            "JOIN episodes.episodes_index e ON e.crc32 = c.crc32 "
+            "WHERE e.title IS NOT NULL AND e.title != ''"
+        )
+        return c.fetchall()
+    finally:
+        c.execute("DETACH DATABASE episodes")
+
+
+def _build_rename_plan(matches):
+    """Build a plan of files to rename based on CRC32 matches.
+    Matches come from crc32_cache, so file paths are already normalized absolute paths
+    and can be compared to the target path as plain strings.
+    Args:
+        matches: Iterable of (file_path, title) tuples from _load_rename_matches
+    Returns: List of (old_path, new_path) tuples"""
     rename_plan = []
-    for file_path, crc32 in entries:
-        title = crc32_to_title.get(crc32)
-        if not title:
-            continue  # No match found in index, skip
-        dir_name = os.path.dirname(file_path)
+    for file_path, title in matches:
         # Sanitize title for filename (remove problematic characters)
-        sanitized_title = re.sub(r'[\\/*?:"<>|]', "", title).strip()
-        new_filename = f"{sanitized_title}"
-        new_path = os.path.join(dir_name, new_filename)
-        if os.path.abspath(file_path) != os.path.abspath(new_path):
+        sanitized_title = title.translate(FILENAME_SANITIZE_TABLE).strip()
+        new_path = os.path.join(os.path.dirname(file_path), sanitized_title)
+        if file_path != new_path:
             rename_plan.append((file_path, new_path))
     return rename_plan
 
@@ -1090,25 +1645,42 @@ def _get_rename_confirmation():
 
 
 def _execute_rename(rename_plan, conn):
-    """Execute the rename plan and update the database."""
-    c = conn.cursor()
-    for old, new in rename_plan:
-        try:
-            if os.path.exists(new):
-                print(f"Cannot rename {old} to {new}: target file already exists.")
-                continue
-            os.rename(old, new)
-            print(f"Renamed {old} to {new}")
-            # Normalize paths for consistent database updates
-            normalized_old = normalize_file_path(old)
-            normalized_new = normalize_file_path(new)
-            # Update DB with new file path
-            c.execute(
-                "UPDATE crc32_cache SET file_path = ? WHERE file_path = ?", (normalized_new, normalized_old)
-            )
-            conn.commit()
-        except (sqlite3.Error, OSError) as e:
-            print(f"Failed to rename {old} to {new}: {e}")
+    """Execute the rename plan and update the database.
+    Cache paths are updated in one transaction after the renames, including when
+    the loop is interrupted, so files already renamed keep their cached CRC32."""
+    renamed_paths = []
+    try:
+        for old, new in rename_plan:
+            try:
+                if os.path.exists(new):
+                    print(f"Cannot rename {old} to {new}: target file already exists.")
+                    continue
+                os.rename(old, new)
+                print(f"Renamed {old} to {new}")
+                # Normalize paths for consistent database updates
+                renamed_paths.append((normalize_file_path(new), normalize_file_path(old)))
+            except OSError as e:
+                print(f"Failed to rename {old} to {new}: {e}")
+    finally:
+        _update_renamed_paths(conn, renamed_paths)
+
+
+def _update_renamed_paths(conn, renamed_paths):
+    """Point cached CRC32 rows at their files' new paths in a single commit.
+    A stale row already cached under a new path is replaced rather than failing the batch;
+    on a database error the whole update is rolled back.
+    Args:
+        conn: Database connection
+        renamed_paths: List of (normalized_new_path, normalized_old_path) tuples"""
+    if not renamed_paths:
+        return
+    try:
+        conn.executemany("UPDATE OR REPLACE crc32_cache SET file_path = ? WHERE file_path = ?", renamed_paths)
+        _bump_crc32_cache_version(conn)
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"Failed to update the database for {len(renamed_paths)} renamed files: {e}")
 
 
 def rename_local_files(conn, dry_run=False):
@@ -1120,20 +1692,14 @@ def rename_local_files(conn, dry_run=False):
         dry_run: If True, only print the rename plan and do not rename or ask for confirmation.
     """
     c = conn.cursor()
-    c.execute("SELECT file_path, crc32 FROM crc32_cache")
-    entries = c.fetchall()
-    if not entries:
+    c.execute("SELECT COUNT(DISTINCT crc32) FROM crc32_cache")
+    total = c.fetchone()[0]
+    if not total:
         print("No entries found in local CRC32 database.")
         return
 
-    # Load CRC32 → title from episodes_index.db
-    crc32_to_title = load_crc32_to_title_from_index()
-    local_crc32s = set()
-    for _, crc32 in entries:
-        local_crc32s.add(crc32)
-
-    total = len(local_crc32s)
-    rename_plan = _build_rename_plan(entries, crc32_to_title)
+    # Match CRC32s against episodes_index.db titles in SQL
+    rename_plan = _build_rename_plan(_load_rename_matches(conn))
 
     if not rename_plan:
         print("No files to rename.")
@@ -1159,20 +1725,29 @@ def rename_local_files(conn, dry_run=False):
 
 def export_db_to_csv(conn):
     """Export local CRC32 database to CSV file.
+    Skipped when the CSV still exists and the cache hasn't changed since it was written.
     Args:
         conn: Database connection"""
     c = conn.cursor()
-    c.execute("SELECT file_path, crc32 FROM crc32_cache")
-    rows = c.fetchall()
     export_csv_path = get_config_path(DB_CSV_FILENAME)
-    with open(export_csv_path, "w", encoding="utf-8", newline="") as f:
+    cache_version = get_metadata(conn, "crc32_cache_version")
+    if (
+        cache_version is not None
+        and cache_version == get_metadata(conn, "last_db_export_version")
+        and os.path.exists(export_csv_path)
+    ):
+        print(f"Database unchanged since last export, keeping {export_csv_path}")
+        return
+    with open(export_csv_path, "w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f, quoting=csv.QUOTE_ALL)
         writer.writerow(["File Path", "CRC32"])
-        for row in rows:
-            writer.writerow(row)
+        # Stream rows straight from the cursor instead of materializing the whole table
+        writer.writerows(c.execute("SELECT file_path, crc32 FROM crc32_cache"))
     print(f"Database exported to {export_csv_path}")
     now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     set_metadata(conn, "last_db_export", now_str)
+    if cache_version is not None:
+        set_metadata(conn, "last_db_export_version", cache_version)
 
 
 def _prompt_folder_interactive(conn):
@@ -1408,8 +1983,10 @@ def _ensure_crc32_cache_complete(folder, conn):
     """Ensure CRC32 cache includes all local video files for the folder.
     If any video files in folder are not in the cache, runs calculate_local_crc32.
     Respects config/data paths from get_config_dir (Docker vs local via env).
+    The folder is scanned once and the file list is shared by the count and the calculation.
     """
-    total_files, recorded_files = _count_video_files(folder, conn)
+    video_files = _scan_video_files(folder)
+    total_files, recorded_files = _count_video_files(folder, conn, video_files)
     if total_files == 0:
         print("No video files found in folder; skipping CRC32 cache check.")
         return
@@ -1419,7 +1996,7 @@ def _ensure_crc32_cache_complete(folder, conn):
             f"CRC32 cache missing {missing_count} of {total_files} files. "
             "Calculating CRC32s for local files..."
         )
-        calculate_local_crc32(folder, conn)
+        calculate_local_crc32(folder, conn, video_files)
     else:
         print("CRC32 cache is up to date for local files.")
 
@@ -1450,79 +2027,77 @@ def _handle_rename_command(conn, base_url=None, dry_run=False, folder=None):
     rename_local_files(conn, dry_run=dry_run)
 
 
-def _count_video_files(folder, conn):
-    """Count total video files and files already recorded in DB."""
-    total_files = 0
-    recorded_files = 0
+def _count_video_files(folder, conn, video_files=None):
+    """Count total video files and files already recorded in DB.
+    Args:
+        folder: Folder path to scan for video files
+        conn: Database connection
+        video_files: Optional result of _scan_video_files(folder), to avoid scanning again
+    Returns: Tuple of (total_files, recorded_files)"""
+    if video_files is None:
+        video_files = _scan_video_files(folder)
+    recorded_files = _count_recorded_paths(conn, [normalized_path for _, normalized_path in video_files])
+    return len(video_files), recorded_files
+
+
+def _count_recorded_paths(conn, paths):
+    """Count how many of the given normalized paths are in the CRC32 cache.
+    Looks paths up in batches with "IN (...)" so only matching rows are read,
+    even when the cache also holds entries for other folders.
+    Returns: Number of paths present in crc32_cache"""
     c = conn.cursor()
-    for root, dirs, files in os.walk(folder):
-        for file in files:
-            ext = os.path.splitext(file)[1].lower()
-            if ext in VIDEO_EXTENSIONS:
-                total_files += 1
-                file_path = os.path.join(root, file)
-                # Normalize path for consistent lookup
-                normalized_path = normalize_file_path(file_path)
-                c.execute("SELECT 1 FROM crc32_cache WHERE file_path = ?", (normalized_path,))
-                if c.fetchone():
-                    recorded_files += 1
-    return total_files, recorded_files
+    recorded = 0
+    for start in range(0, len(paths), SQLITE_IN_BATCH_SIZE):
+        batch = paths[start:start + SQLITE_IN_BATCH_SIZE]
+        placeholders = ",".join("?" * len(batch))
+        c.execute(f"SELECT COUNT(*) FROM crc32_cache WHERE file_path IN ({placeholders})", batch)
+        recorded += c.fetchone()[0]
+    return recorded
 
 
 def _load_old_missing_crc32s():
     """Load CRC32s from previous missing CSV file."""
-    old_missing_crc32s = set()
     missing_csv_path = get_config_path(MISSING_CSV_FILENAME)
-    if os.path.exists(missing_csv_path):
-        with open(missing_csv_path, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            next(reader, None)  # skip header
-            for row in reader:
-                if len(row) >= 1:
-                    title = row[0]
-                    # Extract CRC32 from title if possible
-                    matches = CRC32_REGEX.findall(title)
-                    if matches:
-                        old_missing_crc32s.add(matches[-1].upper())
-    return old_missing_crc32s
+    if not os.path.exists(missing_csv_path):
+        return set()
+    with open(missing_csv_path, "r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # skip header
+        # Extract CRC32 from each title if possible, building the set in one pass
+        crc32s = (_extract_crc32_from_text(row[0]) for row in reader if row)
+        return {crc32 for crc32 in crc32s if crc32}
 
 
 def _save_missing_episodes_csv(missing, crc32_to_text, crc32_to_link, crc32_to_magnet):
     """Save missing episodes to CSV file."""
     missing_csv_path = get_config_path(MISSING_CSV_FILENAME)
     saved_count = 0
-    error_count = 0
-    with open(missing_csv_path, "w", encoding="utf-8", newline="") as f:
+    rows = [
+        (crc32_to_text.get(crc32, f"[CRC32: {crc32}]"), crc32_to_link.get(crc32, ""), crc32_to_magnet.get(crc32, ""))
+        for crc32 in missing
+    ]
+    with open(missing_csv_path, "w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f, quoting=csv.QUOTE_ALL)
         writer.writerow(["Title", "Page Link", CSV_COLUMN_MAGNET_LINK])
-        for crc32 in missing:
-            try:
-                title = crc32_to_text.get(crc32, f"[CRC32: {crc32}]")
-                page_link = crc32_to_link.get(crc32, "")
-                magnet = crc32_to_magnet.get(crc32, "")
-                writer.writerow([title, page_link, magnet])
-                saved_count += 1
-            except (IOError, OSError, csv.Error) as e:
-                error_count += 1
-                print(f"ERROR: Failed to save missing episode with CRC32 '{crc32}': {e}")
-                # Still write a row with available information
-                writer.writerow([f"[ERROR: CRC32 {crc32}]", "", ""])
+        try:
+            writer.writerows(rows)
+            saved_count = len(rows)
+        except (IOError, OSError, csv.Error) as e:
+            print(f"ERROR: Failed to save missing episodes to CSV: {e}")
     
     print(f"Missing files list saved to {missing_csv_path}")
-    if error_count > 0:
-        print(f"WARNING: {error_count} episodes had errors while saving to CSV")
     if saved_count == 0 and len(missing) > 0:
         print(f"ERROR: No episodes were successfully saved to CSV despite {len(missing)} missing episodes!")
         print("This indicates a critical issue with the CRC32 mapping.")
 
 
-def _print_report_header(conn, folder, args):
+def _print_report_header(conn, folder, args, video_files=None):
     """Print header information for the report."""
     last_missing_export = get_metadata(conn, "last_missing_export")
     if last_missing_export:
         print(f"Last missing files list generated on: {last_missing_export}")
 
-    total_files, recorded_files = _count_video_files(folder, conn)
+    total_files, recorded_files = _count_video_files(folder, conn, video_files)
 
     last_run = get_metadata(conn, "last_run")
     if last_run:
@@ -1611,24 +2186,24 @@ def _build_normalized_to_original_mapping(crc32_to_link, nyaa_crc32s_normalized)
 def _build_missing_list(missing_normalized_set, normalized_to_original, crc32_to_link):
     """Build missing episodes list from normalized set.
     Returns tuple: (missing list, mapping_errors list)"""
-    missing = []
-    missing_normalized = list(missing_normalized_set)
+    # Walk the mapping (built in crc32_to_link order) so the list follows Nyaa's order
+    missing = [
+        orig_key for norm_crc, orig_key in normalized_to_original.items()
+        if norm_crc in missing_normalized_set
+    ]
     mapping_errors = []
     
-    for norm_crc in missing_normalized:
-        if norm_crc in normalized_to_original:
-            missing.append(normalized_to_original[norm_crc])
-        else:
-            # Try to find the original key by searching (fallback)
-            found = False
-            for orig_key in crc32_to_link.keys():
-                if str(orig_key).strip().upper() == norm_crc:
-                    missing.append(orig_key)
-                    found = True
-                    break
-            if not found:
-                mapping_errors.append(norm_crc)
-                debug_print(f"ERROR: Could not find original key for normalized CRC32 '{norm_crc}'")
+    for norm_crc in missing_normalized_set.difference(normalized_to_original):
+        # Try to find the original key by searching (fallback)
+        found = False
+        for orig_key in crc32_to_link.keys():
+            if str(orig_key).strip().upper() == norm_crc:
+                missing.append(orig_key)
+                found = True
+                break
+        if not found:
+            mapping_errors.append(norm_crc)
+            debug_print(f"ERROR: Could not find original key for normalized CRC32 '{norm_crc}'")
     
     if mapping_errors:
         debug_print(f"WARNING: {len(mapping_errors)} missing episodes could not be mapped to original keys!")
@@ -1642,7 +2217,7 @@ def _print_comparison_results(nyaa_crc32s_normalized, local_crc32s_normalized,
                               crc32_to_link, local_crc32s, missing, missing_normalized):
     """Print comparison results and troubleshooting information."""
     # Also check the original comparison for debugging
-    original_missing_count = len([c for c in crc32_to_link.keys() if c not in local_crc32s])
+    original_missing_count = len(crc32_to_link.keys() - local_crc32s)
     debug_print(f"Missing episodes (original comparison): {original_missing_count}")
     debug_print(f"Missing episodes (normalized comparison): {len(missing)}")
     debug_print(f"Missing normalized CRC32s: {len(missing_normalized)}")
@@ -1729,11 +2304,12 @@ def _handle_episodes_update_decision(episodes_update_env, last_update_str, base_
     return False
 
 
-def _load_episodes_from_database(episodes_update_env, base_url, fetch_magnets=True):
+def _load_episodes_from_database(episodes_update_env, base_url, episodes_conn, fetch_magnets=True):
     """Load episodes from database, including magnet links stored in database.
     Args:
         episodes_update_env: True if EPISODES_UPDATE environment variable is set
         base_url: Base URL for Nyaa search (unused now, kept for compatibility)
+        episodes_conn: Open episodes index connection, used for reading and for storing fetched magnet links
         fetch_magnets: If True, fetch missing magnet links from Nyaa. If False, use only database.
     Returns: Tuple of (crc32_to_link, crc32_to_text, crc32_to_magnet, last_checked_page)"""
     if episodes_update_env:
@@ -1741,7 +2317,7 @@ def _load_episodes_from_database(episodes_update_env, base_url, fetch_magnets=Tr
     else:
         print("Using episodes index database (EPISODES_UPDATE=false, checking database only)...")
     
-    crc32_to_link, crc32_to_text, crc32_to_magnet = load_1080p_episodes_from_index()
+    crc32_to_link, crc32_to_text, crc32_to_magnet = load_1080p_episodes_from_index(episodes_conn)
     print(f"Loaded {len(crc32_to_link)} 1080p episodes from database.")
     
     # Count how many episodes have magnet links in database
@@ -1760,14 +2336,11 @@ def _load_episodes_from_database(episodes_update_env, base_url, fetch_magnets=Tr
             print(f"Fetched {len(fetched_magnets)} new magnet links.")
             
             # Update database with newly fetched magnet links (batch update for efficiency)
-            conn = init_episodes_db()
-            c = conn.cursor()
-            c.executemany(
+            episodes_conn.executemany(
                 "UPDATE episodes_index SET magnet_link = ? WHERE crc32 = ?",
                 [(magnet_link, crc32) for crc32, magnet_link in fetched_magnets.items()]
             )
-            conn.commit()
-            conn.close()
+            episodes_conn.commit()
     
     # Restrict to episodes we have magnet links for (matches previous behavior)
     # This ensures we only count episodes that can actually be downloaded
@@ -1823,31 +2396,33 @@ def _calculate_missing_episodes(crc32_to_link, local_crc32s):
     return missing
 
 
-def _calculate_and_find_missing(folder, conn, args, last_run):
+def _calculate_and_find_missing(folder, conn, args, last_run, video_files=None):
     """Calculate local CRC32s and find missing episodes."""
     # Check EPISODES_UPDATE environment variable
     episodes_update_env = os.getenv("EPISODES_UPDATE", "").lower() in ("true", "1", "yes", "on")
     
-    # Check if episodes_index exists and has data
-    conn_episodes = init_episodes_db()
-    last_update_str = get_episodes_metadata(conn_episodes, "episodes_db_last_update")
-    
-    # Determine whether to use database or fetch from Nyaa
-    use_database = _handle_episodes_update_decision(episodes_update_env, last_update_str, args.url)
-    conn_episodes.close()
-    
-    # Load episodes (from database or fetch from Nyaa)
-    # Magnet links are now stored in the database, so we load them directly
-    if use_database:
-        # Load episodes from database, including magnet links
-        # fetch_magnets=True will fetch any missing magnet links from Nyaa
-        crc32_to_link, crc32_to_text, crc32_to_magnet, last_checked_page = _load_episodes_from_database(episodes_update_env, args.url, fetch_magnets=True)
-    else:
-        # Normal fetch from Nyaa (only when database doesn't exist and EPISODES_UPDATE=false)
-        print("Fetching episodes metadata from Nyaa...")
-        crc32_to_link, crc32_to_text, crc32_to_magnet, last_checked_page = (
-            fetch_crc32_links(args.url)
-        )
+    # One episodes index connection serves the status check, loading and magnet link updates
+    with closing(init_episodes_db()) as conn_episodes:
+        # Check if episodes_index exists and has data
+        last_update_str = get_episodes_metadata(conn_episodes, "episodes_db_last_update")
+
+        # Determine whether to use database or fetch from Nyaa
+        use_database = _handle_episodes_update_decision(episodes_update_env, last_update_str, args.url)
+
+        # Load episodes (from database or fetch from Nyaa)
+        # Magnet links are now stored in the database, so we load them directly
+        if use_database:
+            # Load episodes from database, including magnet links
+            # fetch_magnets=True will fetch any missing magnet links from Nyaa
+            crc32_to_link, crc32_to_text, crc32_to_magnet, last_checked_page = _load_episodes_from_database(
+                episodes_update_env, args.url, conn_episodes, fetch_magnets=True
+            )
+        else:
+            # Normal fetch from Nyaa (only when database doesn't exist and EPISODES_UPDATE=false)
+            print("Fetching episodes metadata from Nyaa...")
+            crc32_to_link, crc32_to_text, crc32_to_magnet, last_checked_page = (
+                fetch_crc32_links(args.url)
+            )
 
     print(f"Found {len(crc32_to_link)} episodes from Nyaa.")
 
@@ -1859,7 +2434,7 @@ def _calculate_and_find_missing(folder, conn, args, last_run):
             "Calculating local CRC32 hashes - this will take a while on first run!..."
         )
 
-    local_crc32s = calculate_local_crc32(folder, conn)
+    local_crc32s = calculate_local_crc32(folder, conn, video_files)
     print(f"Found {len(local_crc32s)} local CRC32 hashes.")
     
     debug_print(f"DEBUG: Folder scanned: {folder}")
@@ -1891,10 +2466,12 @@ def _report_new_missing_episodes(missing, crc32_to_text):
 
 def _generate_missing_episodes_report(conn, folder, args):
     """Generate and save missing episodes report."""
-    last_run = _print_report_header(conn, folder, args)
+    # Scan the library once; the header counts and the CRC32 pass share the result
+    video_files = _scan_video_files(folder)
+    last_run = _print_report_header(conn, folder, args, video_files)
     
     missing, crc32_to_text, crc32_to_link, crc32_to_magnet, last_checked_page = (
-        _calculate_and_find_missing(folder, conn, args, last_run)
+        _calculate_and_find_missing(folder, conn, args, last_run, video_files)
     )
 
     _report_new_missing_episodes(missing, crc32_to_text)
@@ -2157,8 +2734,9 @@ def main():
 
         if args.episodes_update:
             # When --episodes_update is used: update episodes from Nyaa, then run missing episodes report (like main command)
-            update_episodes_index_db(args.url, force_update=True)
             conn = init_db(suppress_messages=False)
+            _enable_http_cache()
+            update_episodes_index_db(args.url, force_update=True)
             needs_folder = True  # Missing report requires folder
             folder = _get_folder_from_args(args, conn, needs_folder)
             if folder is None:
@@ -2168,6 +2746,7 @@ def main():
 
         # Suppress messages when exporting DB (since it's automated)
         conn = init_db(suppress_messages=args.db)
+        _enable_http_cache()
 
         # Folder selection logic: Always prompt if folder is required but not given
         needs_folder = not args.download  # All commands except --download need folder
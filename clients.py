@@ -5,7 +5,8 @@ import requests  # type: ignore
 import qbittorrentapi  # type: ignore
 import re
 
-# Rate limiting delay between torrent operations (in seconds)
+# Rate limiting delay between qBittorrent operations (in seconds); Transmission RPC calls are
+# already serialized request/response on one keep-alive session and aren't throttled
 TORRENT_OPERATION_DELAY = 0.1
 
 class Client(abc.ABC):
@@ -258,7 +259,6 @@ class TransmissionClient(Client):
                 valid_count += 1
             else:
                 invalid_count += 1
-            time.sleep(TORRENT_OPERATION_DELAY)
         
         print(f"DRY RUN: Summary - {valid_count} valid magnet links would be added, {invalid_count} invalid")
 
@@ -271,7 +271,6 @@ class TransmissionClient(Client):
             print(f"Adding {idx}/{total}: {truncated}")
             if self._add_single_torrent(magnet, download_folder, truncated):
                 added_count += 1
-            time.sleep(TORRENT_OPERATION_DELAY)
         print(f"Added {added_count} torrents to Transmission.")
 
     def add_torrents(self, magnets, download_folder=None, tags=None, category=None, dry_run=False):
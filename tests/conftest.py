@@ -4,8 +4,31 @@ import sqlite3
 import os
 import tempfile
 import shutil
+import sys
+import threading
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import acepace
+
+
+@pytest.fixture(autouse=True)
+def clear_torrent_page_cache():
+    """Start every test with an empty torrent page cache."""
+    acepace._fetch_torrent_filenames.cache_clear()
+    yield
+    acepace._fetch_torrent_filenames.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_http_cache(monkeypatch, tmp_path):
+    """Keep the persistent HTTP cache off unless a test enables it (main() turns it on).
+    Its database goes to a temporary directory, so tests running main() don't leave one behind."""
+    monkeypatch.setattr(acepace, "_http_cache_db_path", None)
+    monkeypatch.setattr(acepace, "_http_cache_local", threading.local())
+    monkeypatch.setattr(acepace, "HTTP_CACHE_DB_NAME", str(tmp_path / "http_cache.db"))
+
 
 @pytest.fixture
 def temp_dir():
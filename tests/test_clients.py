@@ -181,6 +181,7 @@ class TestTransmissionClient:
         client.add_torrents(sample_magnet_links, download_folder="/downloads")
         
         assert mock_session.post.call_count >= len(sample_magnet_links)
+        mock_sleep.assert_not_called()
 
     @patch('clients.requests.Session')
     @patch('clients.time.sleep')
@@ -349,6 +350,7 @@ class TestDryRunMode:
                             if len(call[1].get('json', {}).get('method', '')) > 0 
                             and call[1]['json'].get('method') == 'torrent-add']
         assert len(torrent_add_calls) == 0
+        mock_sleep.assert_not_called()
 
     @patch('clients.requests.Session')
     @patch('clients.time.sleep')
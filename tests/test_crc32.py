@@ -1,6 +1,7 @@
 """Unit tests for CRC32 operations."""
 import pytest
 import zlib
+import mmap
 import os
 import sys
 import tempfile
@@ -50,9 +51,34 @@ class TestCRC32Extraction:
         assert len(matches) == 0
 
 
+    def test_extract_crc32_from_text_takes_last_tag(self):
+        """Test that the helper returns the last CRC32 tag, uppercased, like findall()[-1]."""
+        filenames = [
+            "[One Pace] Episode 1 [1080p][a1b2c3d4].mkv",
+            "[One Pace] Episode 1 [1080p][A1B2C3D4][e5f6a7b8].mkv",
+            "[One Pace][12345678] Episode 1 [1080p][A1B2C3D4] v2.mkv",
+            "[One Pace][A1B2C3D4] Episode 1 with a title long enough to push the tag out of the tail [1080p].mkv",
+            "[One Pace] Episode 1 [1080p][A1B2C3D4] and a long suffix that splits the [E5F6A7B8] tag.mkv",
+            "[One Pace] Episode 1 [1080p][A1B2C3D4]" + "y" * 27,  # tag straddles the tail boundary
+            "[One Pace] Episode 1 [1080p][A1B2C3].mkv",
+        ]
+        for filename in filenames:
+            matches = acepace.CRC32_REGEX.findall(filename)
+            expected = matches[-1].upper() if matches else None
+            assert acepace._extract_crc32_from_text(filename) == expected
+
+
 class TestCRC32Calculation:
     """Tests for CRC32 calculation from file content."""
 
+    def test_calculate_crc32_uses_ieee_polynomial(self, temp_dir):
+        """Test the standard CRC-32 check value, which differs from CRC-32C (E3069283)."""
+        test_file = os.path.join(temp_dir, "check.mkv")
+        with open(test_file, "wb") as f:
+            f.write(b"123456789")
+
+        assert acepace._calculate_file_crc32(test_file) == "CBF43926"
+
     def test_calculate_crc32_from_content(self, sample_video_content, temp_dir):
         """Test calculating CRC32 from file content."""
         test_file = os.path.join(temp_dir, "test_video.mkv")
@@ -153,3 +179,390 @@ class TestCRC32Calculation:
             conn.close()
             
             assert len(crc32s) == 1
+
+    def test_calculate_file_crc32_spans_multiple_chunks(self, temp_dir):
+        """Test that files larger than one read chunk hash to the whole-file CRC32."""
+        content = os.urandom(1000) * 25
+        test_file = os.path.join(temp_dir, "large.mkv")
+        with open(test_file, "wb") as f:
+            f.write(content)
+
+        with patch('acepace.CRC32_CHUNK_SIZE', 4096):
+            crc32 = acepace._calculate_file_crc32(test_file)
+
+        assert crc32 == f"{zlib.crc32(content) & 0xFFFFFFFF:08X}"
+
+    def test_calculate_file_crc32_falls_back_when_mmap_unsupported(self, temp_dir):
+        """Test that files are read in chunks when the filesystem can't memory-map them."""
+        content = os.urandom(4096 * 3 + 17)
+        test_file = os.path.join(temp_dir, "video.mkv")
+        with open(test_file, "wb") as f:
+            f.write(content)
+
+        with patch('acepace.mmap.mmap', side_effect=OSError("mmap not supported")), \
+             patch('acepace.CRC32_CHUNK_SIZE', 4096):
+            crc32 = acepace._calculate_file_crc32(test_file)
+
+        assert crc32 == f"{zlib.crc32(content) & 0xFFFFFFFF:08X}"
+
+    @pytest.mark.skipif(not hasattr(mmap, "MADV_WILLNEED"), reason="madvise not available")
+    def test_crc32_from_mapping_prefetches_next_slice(self, temp_dir):
+        """Test that each slice after the first is requested with MADV_WILLNEED before it is hashed."""
+        chunk_size = mmap.PAGESIZE
+        content = os.urandom(chunk_size * 3 + 17)
+        test_file = os.path.join(temp_dir, "large.mkv")
+        with open(test_file, "wb") as f:
+            f.write(content)
+
+        class RecordingMap(mmap.mmap):
+            def madvise(self, *args):
+                advised.append(args)
+                return super().madvise(*args)
+
+        advised = []
+        with open(test_file, "rb") as f, \
+             RecordingMap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+             patch('acepace.CRC32_CHUNK_SIZE', chunk_size):
+            crc = acepace._crc32_from_mapping(mapped)
+
+        assert crc == zlib.crc32(content)
+        assert advised == [(mmap.MADV_WILLNEED, offset, chunk_size) for offset in (chunk_size, chunk_size * 2, chunk_size * 3)]
+
+    @pytest.mark.skipif(not hasattr(mmap, "MADV_SEQUENTIAL"), reason="madvise not available")
+    def test_crc32_from_large_file_ignores_rejected_madvise(self, temp_dir):
+        """Test that a filesystem rejecting the MADV_SEQUENTIAL hint still gets hashed."""
+        content = os.urandom(mmap.PAGESIZE * 3 + 17)
+        test_file = os.path.join(temp_dir, "large.mkv")
+        with open(test_file, "wb") as f:
+            f.write(content)
+
+        class RejectingMap(mmap.mmap):
+            def madvise(self, *args):
+                raise OSError(22, "Invalid argument")
+
+        with open(test_file, "rb") as f, \
+             patch('acepace.mmap.mmap', RejectingMap), \
+             patch('acepace.CRC32_CHUNK_SIZE', mmap.PAGESIZE):
+            crc = acepace._crc32_from_large_file(f)
+
+        assert crc == zlib.crc32(content)
+
+    def test_calculate_file_crc32_reads_small_files_in_one_call(self, temp_dir):
+        """Test that files no larger than one chunk are hashed without memory-mapping."""
+        content = os.urandom(4096)
+        test_file = os.path.join(temp_dir, "sample.mkv")
+        with open(test_file, "wb") as f:
+            f.write(content)
+
+        with patch('acepace.mmap.mmap') as mock_mmap, \
+             patch('acepace.CRC32_CHUNK_SIZE', 4096):
+            crc32 = acepace._calculate_file_crc32(test_file)
+
+        mock_mmap.assert_not_called()
+        assert crc32 == f"{zlib.crc32(content):08X}"
+
+    def test_calculate_file_crc32_stops_on_shutdown(self, temp_dir):
+        """Test that hashing returns None when shutdown is requested."""
+        test_file = os.path.join(temp_dir, "video.mkv")
+        with open(test_file, "wb") as f:
+            f.write(b"x" * 100)
+
+        with patch('acepace._shutdown_requested', True):
+            assert acepace._calculate_file_crc32(test_file) is None
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_calculate_file_crc32_leaves_page_cache_alone(self, temp_dir):
+        """Test that hashing a file doesn't evict it from the page cache (other readers may use it)."""
+        test_file = os.path.join(temp_dir, "video.mkv")
+        with open(test_file, "wb") as f:
+            f.write(b"x" * 100)
+
+        with patch('acepace.os.posix_fadvise') as mock_fadvise:
+            acepace._calculate_file_crc32(test_file)
+
+        mock_fadvise.assert_not_called()
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_hash_files_prefetches_next_file_per_worker(self, temp_dir):
+        """Test that each file prefetches the start of the file its worker hashes next."""
+        paths = []
+        for i in range(6):
+            path = os.path.join(temp_dir, f"ep{i}.mkv")
+            with open(path, "wb") as f:
+                f.write(bytes([i]) * 100)
+            paths.append(path)
+        files_to_hash = [(path, path, 100, 0.0) for path in paths]
+
+        with patch('acepace.CRC32_MAX_WORKERS', 2), \
+             patch('acepace._prefetch_file_start') as mock_prefetch, \
+             patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')), \
+             patch('builtins.print'):
+            conn = acepace.init_db()
+            local_crc32s = set()
+            stats = {'processed': 0, 'cached': 0, 'calculated': 0}
+            acepace._hash_files_concurrently(files_to_hash, conn.cursor(), conn, local_crc32s, stats)
+            conn.close()
+
+        assert len(local_crc32s) == 6
+        assert sorted(c.args[0] for c in mock_prefetch.call_args_list) == paths[2:]
+
+    def test_hash_files_skips_unreadable_file(self, temp_dir):
+        """Test that one unreadable file is reported and skipped while the rest of the batch is cached."""
+        paths = []
+        for i in range(4):
+            path = os.path.join(temp_dir, f"ep{i}.mkv")
+            with open(path, "wb") as f:
+                f.write(bytes([i]) * 100)
+            paths.append(path)
+        files_to_hash = [(path, path, 100, 0.0) for path in paths]
+        real_calculate = acepace._calculate_file_crc32
+
+        def calculate(file_path):
+            if file_path == paths[1]:
+                raise PermissionError(13, "Permission denied", file_path)
+            return real_calculate(file_path)
+
+        with patch('acepace._calculate_file_crc32', side_effect=calculate), \
+             patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')), \
+             patch('builtins.print') as mock_print:
+            conn = acepace.init_db()
+            local_crc32s = set()
+            stats = {'processed': 0, 'cached': 0, 'calculated': 0}
+            acepace._hash_files_concurrently(files_to_hash, conn.cursor(), conn, local_crc32s, stats)
+            cached_paths = {row[0] for row in conn.execute("SELECT file_path FROM crc32_cache")}
+            conn.close()
+
+        assert cached_paths == {paths[0], paths[2], paths[3]}
+        assert stats['calculated'] == 3
+        assert any(f"Failed to calculate CRC32 for {paths[1]}" in str(c.args[0]) for c in mock_print.call_args_list)
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_prefetch_file_start_hints_first_chunk(self, temp_dir):
+        """Test that the lookahead asks for the first chunk with POSIX_FADV_WILLNEED, ignoring missing files."""
+        test_file = os.path.join(temp_dir, "video.mkv")
+        with open(test_file, "wb") as f:
+            f.write(b"x" * 100)
+
+        with patch('acepace.os.posix_fadvise') as mock_fadvise:
+            acepace._prefetch_file_start(test_file)
+            acepace._prefetch_file_start(os.path.join(temp_dir, "missing.mkv"))
+
+        mock_fadvise.assert_called_once()
+        assert mock_fadvise.call_args.args[1:] == (0, acepace.CRC32_CHUNK_SIZE, os.POSIX_FADV_WILLNEED)
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_calculate_file_crc32_hints_sequential_reads_without_mmap(self, temp_dir):
+        """Test that the buffered fallback asks the kernel for sequential readahead."""
+        test_file = os.path.join(temp_dir, "video.mkv")
+        with open(test_file, "wb") as f:
+            f.write(b"x" * 10000)
+
+        with patch('acepace.mmap.mmap', side_effect=OSError("mmap not supported")), \
+             patch('acepace.CRC32_CHUNK_SIZE', 4096), \
+             patch('acepace.os.posix_fadvise') as mock_fadvise:
+            acepace._calculate_file_crc32(test_file)
+
+        advices = [c.args[3] for c in mock_fadvise.call_args_list]
+        assert advices == [os.POSIX_FADV_SEQUENTIAL]
+
+    def test_calculate_file_crc32_empty_file(self, temp_dir):
+        """Test that an empty file hashes to 00000000."""
+        test_file = os.path.join(temp_dir, "empty.mkv")
+        open(test_file, "wb").close()
+
+        assert acepace._calculate_file_crc32(test_file) == "00000000"
+
+    def test_calculate_crc32_many_files_concurrently(self, temp_dir):
+        """Test that hashing more files than worker threads caches every file."""
+        contents = [f"episode {i} content".encode() for i in range(10)]
+        for i, content in enumerate(contents):
+            with open(os.path.join(temp_dir, f"ep{i}.mkv"), "wb") as f:
+                f.write(content)
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            crc32s = acepace.calculate_local_crc32(temp_dir, conn)
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM crc32_cache")
+            cached_count = cursor.fetchone()[0]
+            conn.close()
+
+        expected = {f"{zlib.crc32(content) & 0xFFFFFFFF:08X}" for content in contents}
+        assert crc32s == expected
+        assert cached_count == 10
+
+    def test_calculate_crc32_commits_in_batches(self, temp_dir):
+        """Test that hashed files are written in batches and the final partial batch is kept."""
+        for i in range(7):
+            with open(os.path.join(temp_dir, f"ep{i}.mkv"), "wb") as f:
+                f.write(f"batch content {i}".encode())
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')), \
+                patch('acepace.CRC32_CACHE_BATCH_SIZE', 3), \
+                patch('acepace._store_crc32_rows', wraps=acepace._store_crc32_rows) as mock_store:
+            conn = acepace.init_db()
+            acepace.calculate_local_crc32(temp_dir, conn)
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM crc32_cache")
+            cached_count = cursor.fetchone()[0]
+            conn.close()
+
+        assert cached_count == 7
+        # Two full batches of 3 plus the final flush of the remaining file
+        assert mock_store.call_count == 3
+
+    def test_calculate_crc32_reads_cache_with_one_query(self, temp_dir):
+        """Test that cache lookups cost one SELECT in total, not one per file."""
+        for i in range(5):
+            with open(os.path.join(temp_dir, f"ep{i}.mkv"), "wb") as f:
+                f.write(f"cached content {i}".encode())
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            acepace.calculate_local_crc32(temp_dir, conn)
+
+            statements = []
+            conn.set_trace_callback(statements.append)
+            crc32s = acepace.calculate_local_crc32(temp_dir, conn)
+            conn.set_trace_callback(None)
+            conn.close()
+
+        assert len(crc32s) == 5
+        cache_selects = [s for s in statements if s.lstrip().upper().startswith("SELECT") and "crc32_cache" in s]
+        assert len(cache_selects) == 1
+
+    def test_calculate_crc32_rehashes_changed_file(self, temp_dir):
+        """Test that a file replaced under the same path is hashed again instead of reusing its cached CRC32."""
+        test_file = os.path.join(temp_dir, "episode.mkv")
+        with open(test_file, "wb") as f:
+            f.write(b"original content")
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            first = acepace.calculate_local_crc32(temp_dir, conn)
+
+            with open(test_file, "wb") as f:
+                f.write(b"replacement content, longer")
+            second = acepace.calculate_local_crc32(temp_dir, conn)
+            conn.close()
+
+        assert first == {f"{zlib.crc32(b'original content') & 0xFFFFFFFF:08X}"}
+        assert second == {f"{zlib.crc32(b'replacement content, longer') & 0xFFFFFFFF:08X}"}
+
+    def test_calculate_crc32_trusts_and_backfills_legacy_rows(self, temp_dir):
+        """Test that rows cached without size/mtime are reused and get their stat info recorded."""
+        test_file = os.path.join(temp_dir, "episode.mkv")
+        with open(test_file, "wb") as f:
+            f.write(b"episode content")
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            conn.execute(
+                "INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+                (acepace.normalize_file_path(test_file), "A1B2C3D4")
+            )
+            conn.commit()
+
+            with patch('acepace._calculate_file_crc32') as mock_calc:
+                crc32s = acepace.calculate_local_crc32(temp_dir, conn)
+                mock_calc.assert_not_called()
+            size, mtime = conn.execute("SELECT size, mtime FROM crc32_cache").fetchone()
+            conn.close()
+
+        st = os.stat(test_file)
+        assert crc32s == {"A1B2C3D4"}
+        assert (size, mtime) == (st.st_size, st.st_mtime)
+
+    def test_calculate_crc32_reuses_cached_crc32_for_moved_file(self, temp_dir):
+        """Test that a file renamed outside Ace-Pace keeps its CRC32 (same size and mtime) without rehashing."""
+        old_file = os.path.join(temp_dir, "episode.mkv")
+        with open(old_file, "wb") as f:
+            f.write(b"episode content")
+        new_file = os.path.join(temp_dir, "renamed.mkv")
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            first = acepace.calculate_local_crc32(temp_dir, conn)
+            os.rename(old_file, new_file)
+
+            with patch('acepace._calculate_file_crc32') as mock_calc:
+                second = acepace.calculate_local_crc32(temp_dir, conn)
+                mock_calc.assert_not_called()
+            row = conn.execute(
+                "SELECT crc32 FROM crc32_cache WHERE file_path = ?", (acepace.normalize_file_path(new_file),)
+            ).fetchone()
+            conn.close()
+
+        assert second == first
+        assert row == (next(iter(first)),)
+
+    def test_calculate_crc32_replaces_row_of_file_renamed_outside(self, temp_dir):
+        """Test that a file renamed outside Ace-Pace takes over its old row, while rows of files the scan didn't find are kept."""
+        library = os.path.join(temp_dir, "library")
+        os.makedirs(library)
+        paths = {name: os.path.join(library, name) for name in ("a.mkv", "b.mkv")}
+        for name, path in paths.items():
+            with open(path, "wb") as f:
+                f.write(name.encode() * 10)
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            acepace.calculate_local_crc32(library, conn)
+
+            os.rename(paths["a.mkv"], os.path.join(library, "a renamed.mkv"))  # Same size and mtime
+            os.remove(paths["b.mkv"])
+            acepace.calculate_local_crc32(library, conn)
+
+            cached_paths = {row[0] for row in conn.execute("SELECT file_path FROM crc32_cache")}
+            conn.close()
+
+        assert cached_paths == {
+            acepace.normalize_file_path(os.path.join(library, "a renamed.mkv")),
+            acepace.normalize_file_path(paths["b.mkv"]),
+        }
+
+    @pytest.mark.parametrize("folder_missing", [True, False])
+    def test_calculate_crc32_keeps_cache_when_folder_missing_or_empty(self, temp_dir, folder_missing):
+        """Test that an unmounted or empty library folder leaves the cache untouched."""
+        library = os.path.join(temp_dir, "library")
+        os.makedirs(library)
+        for name in ("a.mkv", "b.mkv"):
+            with open(os.path.join(library, name), "wb") as f:
+                f.write(name.encode() * 10)
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            acepace.calculate_local_crc32(library, conn)
+            cached_before = conn.execute("SELECT * FROM crc32_cache ORDER BY file_path").fetchall()
+
+            for name in ("a.mkv", "b.mkv"):
+                os.remove(os.path.join(library, name))
+            if folder_missing:
+                os.rmdir(library)
+            assert acepace.calculate_local_crc32(library, conn) == set()
+            cached_after = conn.execute("SELECT * FROM crc32_cache ORDER BY file_path").fetchall()
+            conn.close()
+
+        assert len(cached_before) == 2
+        assert cached_after == cached_before
+
+    def test_calculate_crc32_moves_row_of_file_moved_from_other_folder(self, temp_dir):
+        """Test that a file moved in from another folder takes over its old row instead of duplicating it."""
+        old_folder = os.path.join(temp_dir, "downloads")
+        new_folder = os.path.join(temp_dir, "library")
+        os.makedirs(old_folder)
+        os.makedirs(new_folder)
+        old_file = os.path.join(old_folder, "episode.mkv")
+        with open(old_file, "wb") as f:
+            f.write(b"episode content")
+        new_file = os.path.join(new_folder, "episode.mkv")
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            acepace.calculate_local_crc32(old_folder, conn)
+            os.rename(old_file, new_file)
+            acepace.calculate_local_crc32(new_folder, conn)
+            cached_paths = [row[0] for row in conn.execute("SELECT file_path FROM crc32_cache")]
+            conn.close()
+
+        assert cached_paths == [acepace.normalize_file_path(new_file)]
@@ -83,6 +83,22 @@ class TestDatabaseInitialization:
                 assert any("Database already exists" in str(call) for call in print_calls)
 
 
+    def test_get_config_path_creates_config_dir_once(self, temp_dir, monkeypatch):
+        """Test that the config directory is created on first use and not re-checked afterwards."""
+        config_dir = os.path.join(temp_dir, "config")
+        monkeypatch.setenv("ACEPACE_CONFIG_DIR_LOCAL", config_dir)
+        monkeypatch.setattr(acepace, "_ensured_config_dirs", set())
+
+        with patch('acepace.IS_DOCKER', False), \
+             patch('acepace.os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            first = acepace.get_config_path("a.db")
+            second = acepace.get_config_path("b.db")
+
+        assert os.path.isdir(config_dir)
+        assert (first, second) == (os.path.join(config_dir, "a.db"), os.path.join(config_dir, "b.db"))
+        mock_makedirs.assert_called_once_with(config_dir, exist_ok=True)
+
+
 class TestMetadataOperations:
     """Tests for metadata get/set operations."""
 
@@ -198,3 +214,146 @@ class TestEpisodesIndexOperations:
             assert crc32_to_magnet["E5F6A7B8"] == "magnet:?xt=urn:btih:def456"
             
             os.remove(os.path.join(temp_dir, 'test.db'))
+
+
+    def test_load_from_index_reuses_given_connection(self, temp_dir):
+        """Test that passing an open connection reuses it and leaves it open."""
+        with patch('acepace.EPISODES_DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_episodes_db()
+            conn.execute(
+                "INSERT INTO episodes_index (crc32, title, page_link, magnet_link) VALUES (?, ?, ?, ?)",
+                ("A1B2C3D4", "[One Pace] Episode 1 [1080p][A1B2C3D4].mkv", "https://nyaa.si/view/1", "")
+            )
+            conn.commit()
+
+            with patch('acepace.init_episodes_db') as mock_init:
+                crc32_to_link, _, _ = acepace.load_1080p_episodes_from_index(conn)
+                mapping = acepace.load_crc32_to_title_from_index(conn)
+                mock_init.assert_not_called()
+
+            # Still usable afterwards
+            conn.execute("SELECT 1").fetchone()
+            conn.close()
+
+        assert crc32_to_link == {"A1B2C3D4": "https://nyaa.si/view/1"}
+        assert mapping == {"A1B2C3D4": "[One Pace] Episode 1 [1080p][A1B2C3D4].mkv"}
+
+class TestCRC32CacheOperations:
+    """Tests for local CRC32 cache lookups."""
+
+    def test_load_cache_entries_returns_path_mapping(self, temp_dir):
+        """Test that the whole CRC32 cache is loaded as a path -> (CRC32, size, mtime) mapping."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            cursor = conn.cursor()
+            cursor.executemany(
+                "INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+                [("/media/a.mkv", "A1B2C3D4"), ("/media/b.mkv", "E5F6A7B8")]
+            )
+            conn.commit()
+
+            cached = acepace._load_cache_entries(conn)
+            conn.close()
+
+        assert cached == {"/media/a.mkv": ("A1B2C3D4", None, None), "/media/b.mkv": ("E5F6A7B8", None, None)}
+
+    def test_load_cache_entries_empty_cache(self, temp_dir):
+        """Test that an empty cache loads as an empty mapping."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            cached = acepace._load_cache_entries(conn)
+            conn.close()
+
+        assert cached == {}
+
+    def test_count_recorded_paths_batches_lookups(self, temp_dir):
+        """Test that recorded paths are counted correctly across several IN batches."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')), \
+             patch('acepace.SQLITE_IN_BATCH_SIZE', 2):
+            conn = acepace.init_db()
+            cursor = conn.cursor()
+            cursor.executemany(
+                "INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+                [(f"/media/{i}.mkv", f"{i:08X}") for i in range(5)]
+            )
+            conn.commit()
+
+            paths = ["/media/0.mkv", "/media/missing.mkv", "/media/3.mkv", "/media/4.mkv", "/other/1.mkv"]
+            recorded = acepace._count_recorded_paths(conn, paths)
+            empty = acepace._count_recorded_paths(conn, [])
+            conn.close()
+
+        assert recorded == 3
+        assert empty == 0
+
+    def test_init_db_uses_wal_journal(self, temp_dir):
+        """Test that the CRC32 database uses WAL with synchronous=NORMAL for cheap commits."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            conn.close()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    def test_crc32_cache_keeps_duplicate_copies(self, temp_dir):
+        """Test that two files with the same CRC32 (e.g. a copy in another folder) are both cached."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            conn.executemany(
+                "INSERT OR REPLACE INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+                [("/media/a/ep1.mkv", "A1B2C3D4"), ("/media/b/ep1.mkv", "A1B2C3D4")]
+            )
+            conn.commit()
+            count = conn.execute("SELECT COUNT(*) FROM crc32_cache").fetchone()[0]
+            conn.close()
+
+        assert count == 2
+
+    def test_init_db_migrates_unique_crc32_schema(self, temp_dir):
+        """Test that a cache created with a UNIQUE crc32 column is migrated with its rows intact."""
+        db_path = os.path.join(temp_dir, 'test.db')
+        legacy = sqlite3.connect(db_path)
+        legacy.execute("CREATE TABLE crc32_cache (file_path TEXT PRIMARY KEY, crc32 TEXT UNIQUE)")
+        legacy.executemany(
+            "INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+            [("/media/a.mkv", "A1B2C3D4"), ("/media/b.mkv", "E5F6A7B8")]
+        )
+        legacy.commit()
+        legacy.close()
+
+        with patch('acepace.DB_NAME', db_path):
+            conn = acepace.init_db(suppress_messages=True)
+            schema = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'crc32_cache'"
+            ).fetchone()[0]
+            cached = acepace._load_cache_entries(conn)
+            conn.close()
+
+        assert "UNIQUE" not in schema.upper()
+        assert cached == {"/media/a.mkv": ("A1B2C3D4", None, None), "/media/b.mkv": ("E5F6A7B8", None, None)}
+
+    def test_metadata_lookups_use_primary_key(self, temp_dir):
+        """Test that metadata tables in both databases are keyed directly on their primary key."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')), \
+                patch('acepace.EPISODES_DB_NAME', os.path.join(temp_dir, 'episodes.db')):
+            for conn in (acepace.init_db(), acepace.init_episodes_db()):
+                plan = conn.execute("EXPLAIN QUERY PLAN SELECT value FROM metadata WHERE key = ?", ("k",)).fetchall()
+                conn.close()
+                assert "USING PRIMARY KEY" in plan[0][-1]
+
+    def test_crc32_cache_lookups_use_indexes(self, temp_dir):
+        """Test that lookups by file path and by CRC32 are index searches, not table scans."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            cursor = conn.cursor()
+            plans = []
+            for column in ("file_path", "crc32"):
+                cursor.execute(f"EXPLAIN QUERY PLAN SELECT 1 FROM crc32_cache WHERE {column} = ?", ("x",))
+                plans.append(" ".join(row[-1] for row in cursor.fetchall()))
+            conn.close()
+
+        for plan in plans:
+            assert plan.startswith("SEARCH"), plan
+            assert not plan.startswith("SCAN")
@@ -3,6 +3,12 @@ import pytest
 import os
 import sys
 from unittest.mock import patch, MagicMock, Mock
+import requests
+import sqlite3
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from bs4 import BeautifulSoup
 
 # Add parent directory to path to import acepace
@@ -48,7 +54,7 @@ def _create_mock_response(html_content):
 class TestEpisodeMetadataFetching:
     """Tests for fetching episode metadata from Nyaa."""
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_single_page(self, mock_get, mock_nyaa_html_single_page):
         """Test fetching episodes from a single page."""
         mock_response = MagicMock()
@@ -68,7 +74,7 @@ class TestEpisodeMetadataFetching:
         call_urls = [call[0][0] for call in mock_get.call_args_list]
         assert any("q=one+pace" in url and "1080p" not in url for url in call_urls)
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_uses_custom_url(self, mock_get, mock_nyaa_html_single_page):
         """Test that fetch_episodes_metadata uses the provided URL parameter."""
         mock_response = MagicMock()
@@ -88,7 +94,7 @@ class TestEpisodeMetadataFetching:
         for url in call_urls:
             assert url.startswith(custom_url + "&p=") or url == custom_url + "&p=1"
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_default_url_when_none_provided(self, mock_get, mock_nyaa_html_single_page):
         """Test that fetch_episodes_metadata uses default URL when None is provided."""
         mock_response = MagicMock()
@@ -107,9 +113,8 @@ class TestEpisodeMetadataFetching:
         # Should use default URL without 1080p
         assert any("q=one+pace" in url and "1080p" not in url for url in call_urls)
 
-    @patch('acepace.requests.get')
-    @patch('acepace.time.sleep')  # Mock sleep to speed up tests
-    def test_fetch_episodes_metadata_multi_page(self, mock_sleep, mock_get, mock_nyaa_html_multi_page):
+    @patch('acepace._HTTP_SESSION.get')
+    def test_fetch_episodes_metadata_multi_page(self, mock_get, mock_nyaa_html_multi_page):
         """Test fetching episodes from multiple pages."""
         # First page response
         mock_response1 = MagicMock()
@@ -146,7 +151,44 @@ class TestEpisodeMetadataFetching:
         assert len(episodes) >= 2
         assert mock_get.call_count >= 2
 
-    @patch('acepace.requests.get')
+    def test_iter_listing_pages_yields_in_page_order(self):
+        """Test that concurrently fetched pages are yielded in page order."""
+        import time
+
+        def fake_fetch(base_url, page):
+            # Earlier pages finish last to exercise out-of-order completion
+            time.sleep(0.01 * (5 - page))
+            return f"soup{page}", True
+
+        pages = list(acepace._iter_listing_pages(fake_fetch, "https://nyaa.si/?q=x", 4, "soup1"))
+
+        assert pages == [(1, "soup1", True), (2, "soup2", True), (3, "soup3", True), (4, "soup4", True)]
+
+    def test_iter_listing_pages_single_page_does_not_fetch(self):
+        """Test that a single-page listing reuses the first page soup without fetching."""
+        fake_fetch = MagicMock()
+
+        pages = list(acepace._iter_listing_pages(fake_fetch, "https://nyaa.si/?q=x", 1, "soup1"))
+
+        assert pages == [(1, "soup1", True)]
+        fake_fetch.assert_not_called()
+
+    @patch('acepace.ThreadPoolExecutor')
+    def test_iter_listing_pages_cancels_unconsumed_fetches(self, mock_executor_class):
+        """Test that stopping early cancels pending fetches without shutdown(cancel_futures=...) (Python 3.8)."""
+        executor = mock_executor_class.return_value
+        pending = [MagicMock() for _ in range(3)]
+        executor.submit.side_effect = pending
+
+        pages = acepace._iter_listing_pages(MagicMock(), "https://nyaa.si/?q=x", 4, "soup1")
+        assert next(pages) == (1, "soup1", True)
+        pages.close()
+
+        for future in pending:
+            future.cancel.assert_called_once()
+        executor.shutdown.assert_called_once_with(wait=False)
+
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_crc32_in_title(self, mock_get):
         """Test extracting CRC32 from title directly."""
         html = """
@@ -179,7 +221,7 @@ class TestEpisodeMetadataFetching:
         assert len(episodes[0]) == 4
         assert episodes[0][3] == ""  # No magnet link in this test HTML
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_extracts_magnet_links(self, mock_get):
         """Test that magnet links are extracted from search rows."""
         html = """
@@ -211,7 +253,7 @@ class TestEpisodeMetadataFetching:
         assert crc32 == "A1B2C3D4"
         assert magnet_link == "magnet:?xt=urn:btih:test123456789"
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_crc32_from_file_list(self, mock_get, mock_nyaa_torrent_page):
         """Test extracting CRC32 from torrent page file list."""
         # Listing page without CRC32 in title
@@ -248,7 +290,7 @@ class TestEpisodeMetadataFetching:
         assert len(episodes) == 1
         assert episodes[0][0] == "A1B2C3D4"
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_handles_http_error(self, mock_get):
         """Test that HTTP errors are handled gracefully."""
         mock_response = MagicMock()
@@ -259,7 +301,7 @@ class TestEpisodeMetadataFetching:
         
         assert len(episodes) == 0
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_deduplicates_crc32(self, mock_get):
         """Test that duplicate CRC32s are not added multiple times."""
         html = """
@@ -294,6 +336,146 @@ class TestEpisodeMetadataFetching:
         crc32s = [ep[0] for ep in episodes]
         assert crc32s.count("A1B2C3D4") == 1
 
+    @patch('acepace._HTTP_SESSION.get')
+    def test_fetch_episodes_metadata_fetches_each_torrent_page_once(self, mock_get, mock_nyaa_torrent_page):
+        """Test that a torrent page listed in several rows is only fetched once."""
+        row = """
+                    <tr>
+                        <td>
+                            <a href="/view/12345" title="[One Pace] Episode 1">[One Pace] Episode 1</a>
+                        </td>
+                    </tr>"""
+        listing_html = f"""
+        <html>
+            <body>
+                <table class="torrent-list">{row}{row}
+                </table>
+                <ul class="pagination">
+                    <li><a href="?p=1">1</a></li>
+                </ul>
+            </body>
+        </html>
+        """
+        mock_listing_response = MagicMock()
+        mock_listing_response.status_code = 200
+        mock_listing_response.text = listing_html
+
+        mock_torrent_response = MagicMock()
+        mock_torrent_response.status_code = 200
+        mock_torrent_response.text = mock_nyaa_torrent_page
+
+        mock_get.side_effect = [mock_listing_response, mock_torrent_response]
+
+        episodes = acepace.fetch_episodes_metadata()
+
+        assert mock_get.call_count == 2
+        assert [ep[0] for ep in episodes] == ["A1B2C3D4"]
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_fetch_episodes_metadata_prefetches_torrent_pages_in_parallel(self, mock_get):
+        """Test that torrent pages of a listing page are prefetched once each and episodes keep row order."""
+        rows = "".join(
+            f"""
+                    <tr>
+                        <td>
+                            <a href="/view/{view_id}" title="[One Pace] Batch {view_id}">[One Pace] Batch {view_id}</a>
+                        </td>
+                    </tr>"""
+            for view_id in (1, 2, 3)
+        )
+        listing_html = f"""
+        <html>
+            <body>
+                <table class="torrent-list">{rows}
+                </table>
+                <ul class="pagination">
+                    <li><a href="?p=1">1</a></li>
+                </ul>
+            </body>
+        </html>
+        """
+        crc32_by_view = {"1": "A1B2C3D4", "2": "E5F6A7B8", "3": "A9B0C1D2"}
+
+        def fake_get(url, timeout=None):
+            response = MagicMock()
+            response.status_code = 200
+            if "/view/" in url:
+                view_id = url.rsplit("/", 1)[-1]
+                response.text = (
+                    '<div class="torrent-file-list"><ul><li>'
+                    f"[One Pace] Episode {view_id} [1080p][{crc32_by_view[view_id]}].mkv"
+                    "</li></ul></div>"
+                )
+            else:
+                response.text = listing_html
+            return response
+
+        mock_get.side_effect = fake_get
+
+        episodes = acepace.fetch_episodes_metadata()
+
+        fetched = [c.args[0] for c in mock_get.call_args_list if "/view/" in c.args[0]]
+        assert sorted(fetched) == [f"{acepace.NYAA_BASE_URL}/view/{i}" for i in (1, 2, 3)]
+        assert [ep[0] for ep in episodes] == ["A1B2C3D4", "E5F6A7B8", "A9B0C1D2"]
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_failed_torrent_page_fetch_is_not_cached(self, mock_get, mock_nyaa_torrent_page):
+        """Test that a failed torrent page fetch is retried on the next request."""
+        failed_response = MagicMock()
+        failed_response.status_code = 503
+        ok_response = MagicMock()
+        ok_response.status_code = 200
+        ok_response.text = mock_nyaa_torrent_page
+        mock_get.side_effect = [failed_response, ok_response]
+
+        seen_crc32, episodes = set(), []
+        page_link = "https://nyaa.si/view/12345"
+        assert acepace._process_torrent_page(page_link, seen_crc32, episodes) is False
+        assert acepace._process_torrent_page(page_link, seen_crc32, episodes) is True
+        assert episodes[0][0] == "A1B2C3D4"
+
+
+class TestMagnetLinkSearch:
+    """Tests for fetching magnet links for known episodes from search results."""
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_fetch_magnet_links_across_pages(self, mock_get):
+        """Test that magnet links are collected from later pages fetched concurrently."""
+        def page_html(page, crc32):
+            return f"""
+            <table class="torrent-list">
+                <tr>
+                    <td>
+                        <a href="/view/{page}" title="[One Pace] Episode {page} [1080p][{crc32}].mkv">[One Pace] Episode {page} [1080p][{crc32}].mkv</a>
+                        <a href="magnet:?xt=urn:btih:{page:040d}">Magnet</a>
+                    </td>
+                </tr>
+            </table>
+            <ul class="pagination"><li><a href="?p=1">1</a></li><li><a href="?p=2">2</a></li><li><a href="?p=3">3</a></li></ul>
+            """
+        pages = {1: page_html(1, "A1B2C3D4"), 2: page_html(2, "E5F6A7B8"), 3: page_html(3, "A9B0C1D2")}
+
+        def fake_get(url, timeout=None):
+            response = MagicMock()
+            if "&p=" not in url:
+                response.status_code = 404
+                return response
+            response.status_code = 200
+            response.text = pages[int(url.rsplit("&p=", 1)[-1])]
+            return response
+
+        mock_get.side_effect = fake_get
+
+        crc32_to_magnet = acepace.fetch_magnet_links_for_episodes_from_search(
+            "https://nyaa.si/?f=0&c=0_0&q=one+pace",
+            {"A1B2C3D4": "https://nyaa.si/view/1", "A9B0C1D2": "https://nyaa.si/view/3"},
+        )
+
+        assert crc32_to_magnet == {
+            "A1B2C3D4": f"magnet:?xt=urn:btih:{1:040d}",
+            "A9B0C1D2": f"magnet:?xt=urn:btih:{3:040d}",
+        }
+
 
 class TestUpdateEpisodesIndex:
     """Tests for updating episodes index database."""
@@ -332,17 +514,71 @@ class TestUpdateEpisodesIndex:
             acepace.update_episodes_index_db(test_url)
             
             # Verify fetch_episodes_metadata was called with the URL
-            mock_fetch.assert_called_once_with(test_url)
+            mock_fetch.assert_called_once_with(test_url, no_crc_pages=set())
             
             # Clean up
             if os.path.exists(os.path.join(temp_dir, 'test.db')):
                 os.remove(os.path.join(temp_dir, 'test.db'))
 
 
+    @patch('acepace._HTTP_SESSION.get')
+    def test_update_episodes_index_db_skips_pages_without_episode_files(self, mock_get, temp_dir):
+        """Test that torrent pages listing no episode file are remembered and not fetched again."""
+        listing_html = """
+        <table class="torrent-list">
+            <tr><td>
+                <a href="/view/777" title="[One Pace] Extras Pack">[One Pace] Extras Pack</a>
+                <a href="magnet:?xt=urn:btih:abc">Magnet</a>
+            </td></tr>
+        </table>
+        """
+        torrent_html = """
+        <div class="torrent-file-list"><ul><li>Cover Art.png</li></ul></div>
+        """
+
+        def fake_get(url, timeout=None):
+            response = MagicMock()
+            response.status_code = 200
+            response.text = torrent_html if "/view/" in url else listing_html
+            return response
+
+        mock_get.side_effect = fake_get
+
+        with patch('acepace.EPISODES_DB_NAME', os.path.join(temp_dir, 'test.db')):
+            acepace.update_episodes_index_db(force_update=True)
+            acepace._fetch_torrent_filenames.cache_clear()
+            mock_get.reset_mock()
+            acepace.update_episodes_index_db(force_update=True)
+
+            conn = acepace.init_episodes_db()
+            no_crc_pages = acepace._load_no_crc_pages(conn)
+            conn.close()
+
+        assert no_crc_pages == {"https://nyaa.si/view/777"}
+        requested_urls = [call.args[0] for call in mock_get.call_args_list]
+        assert not any("/view/" in url for url in requested_urls)
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_process_torrent_page_does_not_remember_page_without_file_list(self, mock_get):
+        """Test that a 200 response without a file list (error page, new layout) isn't negative-cached."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "<html><body><h1>Something went wrong</h1></body></html>"
+        mock_get.return_value = mock_response
+        no_crc_pages = set()
+        episodes = []
+
+        found = acepace._process_torrent_page("https://nyaa.si/view/777", set(), episodes, no_crc_pages=no_crc_pages)
+
+        assert found is False
+        assert episodes == []
+        assert no_crc_pages == set()
+
+
 class TestEpisodeQualityFiltering:
     """Tests for ensuring only 1080p episodes are extracted."""
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_prefers_1080p(self, mock_get):
         """Test that 1080p episodes are extracted when available."""
         html = _create_nyaa_html_page([
@@ -359,7 +595,7 @@ class TestEpisodeQualityFiltering:
             assert "[1080p]" in title.upper() or "1080P" in title.upper()
             assert "[One Pace]" in title
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_rejects_720p(self, mock_get):
         """Test that 720p episodes are rejected (only 1080p accepted)."""
         html = _create_nyaa_html_page([
@@ -373,7 +609,7 @@ class TestEpisodeQualityFiltering:
         # All 720p episodes should be rejected
         assert len(episodes) == 0
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_excludes_lower_quality(self, mock_get):
         """Test that episodes with quality other than 1080p are excluded."""
         html = _create_nyaa_html_page([
@@ -388,7 +624,7 @@ class TestEpisodeQualityFiltering:
         # Lower quality episodes should be excluded
         assert len(episodes) == 0
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_only_accepts_1080p_same_episode(self, mock_get):
         """Test that when both 1080p and 720p versions exist for same episode, only 1080p is accepted."""
         html = _create_nyaa_html_page([
@@ -407,7 +643,7 @@ class TestEpisodeQualityFiltering:
         assert "[1080p]" in title.upper() or "1080P" in title.upper()
         assert "[720p]" not in title.upper() and "720P" not in title.upper()
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_mixed_qualities_only_keeps_1080p(self, mock_get):
         """Test that mixed quality episodes only keeps 1080p."""
         html = _create_nyaa_html_page([
@@ -432,7 +668,7 @@ class TestEpisodeQualityFiltering:
             assert "[360P]" not in title_upper
             assert "[240P]" not in title_upper
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_handles_case_insensitive_quality(self, mock_get):
         """Test that quality detection is case-insensitive (1080p only)."""
         html = _create_nyaa_html_page([
@@ -453,7 +689,7 @@ class TestEpisodeQualityFiltering:
         # Verify 720p is rejected
         assert "[720P]" not in title_upper
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_excludes_episodes_without_quality_marker(self, mock_get):
         """Test that episodes without quality markers are excluded."""
         html = """
@@ -490,9 +726,8 @@ class TestEpisodeQualityFiltering:
         assert crc32 == "E5F6A7B8"
         assert "[1080p]" in title.upper() or "1080P" in title.upper()
 
-    @patch('acepace.requests.get')
-    @patch('acepace.time.sleep')
-    def test_fetch_episodes_quality_filtering_from_file_list(self, mock_sleep, mock_get):
+    @patch('acepace._HTTP_SESSION.get')
+    def test_fetch_episodes_quality_filtering_from_file_list(self, mock_get):
         """Test quality filtering when CRC32 is extracted from torrent file list."""
         # Listing page
         listing_html = """
@@ -543,9 +778,8 @@ class TestEpisodeQualityFiltering:
         assert crc32 == "A1B2C3D4"
         assert "[1080p]" in title.upper() or "1080P" in title.upper()
 
-    @patch('acepace.requests.get')
-    @patch('acepace.time.sleep')
-    def test_fetch_episodes_quality_filtering_from_file_list_excludes_lower_quality(self, mock_sleep, mock_get):
+    @patch('acepace._HTTP_SESSION.get')
+    def test_fetch_episodes_quality_filtering_from_file_list_excludes_lower_quality(self, mock_get):
         """Test that lower quality episodes are excluded when extracted from file list."""
         # Listing page
         listing_html = """
@@ -594,6 +828,209 @@ class TestEpisodeQualityFiltering:
         assert len(episodes) == 0
 
 
+class TestHTTPSession:
+    """Tests for the shared HTTP session used for Nyaa requests."""
+
+    def test_http_session_retries_transient_errors(self):
+        """Test that the session retries transient statuses and keeps the final response."""
+        session = acepace._create_http_session()
+        retry = session.get_adapter("https://nyaa.si").max_retries
+
+        assert retry.total == 3
+        assert 503 in retry.status_forcelist
+        assert retry.raise_on_status is False
+        assert session.headers["User-Agent"] == acepace.HTTP_USER_AGENT
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_http_get_uses_shared_session_with_timeout(self, mock_get):
+        """Test that requests go through the shared session with a timeout."""
+        acepace._http_get("https://nyaa.si/?p=1")
+
+        mock_get.assert_called_once_with("https://nyaa.si/?p=1", timeout=acepace.HTTP_TIMEOUT)
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_http_get_revalidates_cached_pages(self, mock_get, temp_dir):
+        """Test that cached pages are revalidated and a 304 is served from the cache."""
+        with patch('acepace.get_config_path', return_value=os.path.join(temp_dir, 'http_cache.db')):
+            acepace._enable_http_cache()
+
+        fresh = requests.Response()
+        fresh.status_code = 200
+        fresh.headers["ETag"] = '"v1"'
+        fresh.headers["Last-Modified"] = "Wed, 01 Jan 2025 00:00:00 GMT"
+        fresh.encoding = "utf-8"
+        fresh._content = "<table class=\"torrent-list\"></table>".encode("utf-8")
+        not_modified = requests.Response()
+        not_modified.status_code = 304
+        mock_get.side_effect = [fresh, not_modified]
+
+        first = acepace._http_get("https://nyaa.si/?p=1")
+        second = acepace._http_get("https://nyaa.si/?p=1")
+
+        assert mock_get.call_args_list[0].kwargs["headers"] == {}
+        assert mock_get.call_args_list[1].kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        assert second.status_code == acepace.HTTP_OK
+        assert second.text == first.text
+        stored_body = acepace._load_cached_page("https://nyaa.si/?p=1")[2]
+        assert zlib.decompress(stored_body).decode("utf-8") == first.text
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_http_get_skips_caching_without_validators(self, mock_get, temp_dir):
+        """Test that responses without ETag or Last-Modified are not stored."""
+        with patch('acepace.get_config_path', return_value=os.path.join(temp_dir, 'http_cache.db')):
+            acepace._enable_http_cache()
+
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b"<html></html>"
+        mock_get.return_value = resp
+
+        acepace._http_get("https://nyaa.si/?p=1")
+        acepace._http_get("https://nyaa.si/?p=1")
+
+        assert acepace._load_cached_page("https://nyaa.si/?p=1") is None
+        assert mock_get.call_args_list[1].kwargs["headers"] == {}
+
+    def test_enable_http_cache_prunes_stale_pages(self, temp_dir):
+        """Test that pages not validated within HTTP_CACHE_MAX_AGE are dropped."""
+        now = time.time()
+        with patch('acepace.get_config_path', return_value=os.path.join(temp_dir, 'http_cache.db')):
+            with closing(acepace.init_http_cache_db()) as conn, conn:
+                conn.executemany(
+                    "INSERT INTO http_cache (url, etag, last_modified, body, validated_at) VALUES (?, ?, NULL, ?, ?)",
+                    [
+                        ("https://nyaa.si/?p=old", '"v1"', b"", now - acepace.HTTP_CACHE_MAX_AGE - 60),
+                        ("https://nyaa.si/?p=new", '"v1"', b"", now),
+                    ],
+                )
+            acepace._enable_http_cache()
+
+        assert acepace._load_cached_page("https://nyaa.si/?p=old") is None
+        assert acepace._load_cached_page("https://nyaa.si/?p=new") is not None
+
+    def test_http_cache_is_kept_out_of_crc32_db(self, temp_dir):
+        """Test that pages go to their own database and init_db drops the table older versions kept."""
+        paths = {name: os.path.join(temp_dir, name) for name in (acepace.DB_NAME, acepace.HTTP_CACHE_DB_NAME)}
+        with closing(sqlite3.connect(paths[acepace.DB_NAME])) as conn, conn:
+            conn.execute(
+                "CREATE TABLE http_cache (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB) WITHOUT ROWID"
+            )
+
+        with patch('acepace.get_config_path', side_effect=paths.get):
+            acepace.init_db(suppress_messages=True).close()
+            acepace._enable_http_cache()
+
+        with closing(sqlite3.connect(paths[acepace.DB_NAME])) as conn:
+            crc32_tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        with closing(sqlite3.connect(paths[acepace.HTTP_CACHE_DB_NAME])) as conn:
+            sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'http_cache'").fetchone()[0]
+        assert "http_cache" not in crc32_tables
+        assert "WITHOUT ROWID" not in sql.upper()
+
+    def test_http_cache_connection_is_reused_per_thread(self, temp_dir):
+        """Test that each thread opens one cache connection and reuses it for later requests."""
+        with patch('acepace.get_config_path', return_value=os.path.join(temp_dir, 'http_cache.db')):
+            acepace._enable_http_cache()
+
+        main_conn = acepace._http_cache_connection()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            worker_conns = list(executor.map(lambda _: acepace._http_cache_connection(), range(2)))
+
+        assert acepace._http_cache_connection() is main_conn
+        assert worker_conns[0] is worker_conns[1]
+        assert worker_conns[0] is not main_conn
+
+    @patch('acepace._HTTP_SESSION.get')
+    def test_http_get_reports_cache_errors_in_debug_output(self, mock_get, temp_dir):
+        """Test that a locked cache falls back to a plain fetch and shows up in debug output."""
+        with patch('acepace.get_config_path', return_value=os.path.join(temp_dir, 'http_cache.db')):
+            acepace._enable_http_cache()
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers["ETag"] = '"v1"'
+        resp._content = b"<html></html>"
+        mock_get.return_value = resp
+
+        with patch('acepace._http_cache_connection', side_effect=sqlite3.OperationalError("database is locked")), \
+             patch('acepace.debug_print') as mock_debug:
+            assert acepace._http_get("https://nyaa.si/?p=1") is resp
+
+        messages = [c.args[0] for c in mock_debug.call_args_list]
+        assert len(messages) == 2
+        assert all("database is locked" in message for message in messages)
+
+
+class TestHTMLParsing:
+    """Tests for parsing Nyaa pages with the configured HTML parser."""
+
+    def test_get_total_pages_with_module_parser(self, mock_nyaa_html_multi_page):
+        """Test that pagination is parsed correctly with HTML_PARSER."""
+        soup = BeautifulSoup(mock_nyaa_html_multi_page, acepace.HTML_PARSER)
+        assert acepace._get_total_pages(soup) == 3
+
+    def test_scan_episode_filenames_single_file_with_module_parser(self, mock_nyaa_torrent_page):
+        """Test extracting a single filename from a torrent page with HTML_PARSER."""
+        soup = BeautifulSoup(mock_nyaa_torrent_page, acepace.HTML_PARSER)
+        filenames = acepace._scan_episode_filenames(soup)
+        assert filenames == ("[One Pace] Episode 1 [1080p][A1B2C3D4].mkv",)
+
+    def test_scan_episode_filenames_folder_with_module_parser(self, mock_nyaa_torrent_page_folder):
+        """Test extracting filenames from a folder structure with HTML_PARSER."""
+        soup = BeautifulSoup(mock_nyaa_torrent_page_folder, acepace.HTML_PARSER)
+        filenames = acepace._scan_episode_filenames(soup)
+        assert filenames == ("[One Pace] Episode 1 [1080p][A1B2C3D4].mkv",)
+
+    def test_scan_episode_filenames_skips_folders_sizes_and_other_files(self):
+        """Test that only [One Pace] 1080p names with a CRC32 are kept from a real-looking file list."""
+        html = """
+        <div class="torrent-file-list">
+            <ul>
+                <li><a class="folder"><i class="fa fa-folder-open"></i>[One Pace][1080p] Arc</a>
+                    <ul>
+                        <li><i class="fa fa-file"></i>[One Pace][1-2] Romance Dawn 01 [1080p][A1B2C3D4].mkv <span class="file-size">(1.2 GiB)</span></li>
+                        <li><i class="fa fa-file"></i>[One Pace][1-2] Romance Dawn 01 [720p][E5F6A7B8].mkv <span class="file-size">(600 MiB)</span></li>
+                        <li><i class="fa fa-file"></i>Other Group Episode [1080p][C0FFEE00].mkv <span class="file-size">(1 GiB)</span></li>
+                        <li><i class="fa fa-file"></i>[One Pace] Romance Dawn 02 [1080P][A9B0C1D2].mkv <span class="file-size">(1.1 GiB)</span></li>
+                    </ul>
+                </li>
+            </ul>
+        </div>
+        """
+        soup = acepace._parse_torrent_page(html)
+        filenames = acepace._scan_episode_filenames(soup)
+        assert filenames == (
+            "[One Pace][1-2] Romance Dawn 01 [1080p][A1B2C3D4].mkv",
+            "[One Pace] Romance Dawn 02 [1080P][A9B0C1D2].mkv",
+        )
+
+    def test_scan_episode_filenames_without_file_list(self):
+        """Test that a page without a file list is told apart from an empty file list."""
+        soup = BeautifulSoup("<html><body></body></html>", acepace.HTML_PARSER)
+        assert acepace._scan_episode_filenames(soup) is None
+
+    def test_parse_listing_page_keeps_only_table_and_pagination(self, mock_nyaa_html_multi_page):
+        """Test that listing pages are parsed down to the torrent table and pagination."""
+        html = mock_nyaa_html_multi_page.replace(
+            "<body>", '<body><nav><ul class="nav"><li><a href="/upload">Upload</a></li></ul></nav>'
+        )
+        soup = acepace._parse_listing_page(html)
+
+        assert soup.find("ul", class_="nav") is None
+        assert len(soup.find("table", class_="torrent-list").find_all("tr")) == 1
+        assert acepace._get_total_pages(soup) == 3
+
+    def test_parse_torrent_page_keeps_file_list(self, mock_nyaa_torrent_page_folder):
+        """Test that torrent pages are parsed down to the file list."""
+        soup = acepace._parse_torrent_page(mock_nyaa_torrent_page_folder)
+
+        assert soup.find("body") is None
+        filenames = acepace._scan_episode_filenames(soup)
+        assert "[One Pace] Episode 1 [1080p][A1B2C3D4].mkv" in filenames
+
+
 class TestQualityFilteringHelper:
     """Tests for the quality filtering helper function."""
 
@@ -604,7 +1041,7 @@ class TestQualityFilteringHelper:
         test_cases = [
             "[One Pace] Episode 1 [1080p][A1B2C3D4].mkv",
             "[One Pace] Episode 1 [1080P][A1B2C3D4].mkv",
-            "[One Pace] Episode 1 [1080P][A1B2C3D4].mkv",
+            "[ONE PACE] EPISODE 1 [1080P][A1B2C3D4].MKV",
         ]
         
         for test_case in test_cases:
@@ -648,11 +1085,19 @@ class TestQualityFilteringHelper:
         for test_case in test_cases:
             assert _is_valid_quality(test_case) is False
 
+    def test_quality_filtering_requires_bracketed_marker(self):
+        """Test that 1080p must appear as a bracketed marker, alongside other markers if any."""
+        from acepace import _is_valid_quality
+
+        assert _is_valid_quality("[One Pace] Episode 1 [720p][1080p][A1B2C3D4].mkv") is True
+        assert _is_valid_quality("[One Pace] Episode 1 1080p [A1B2C3D4].mkv") is False
+        assert _is_valid_quality("[One Pace] Episode 1 [10800p][A1B2C3D4].mkv") is False
+
 
 class TestURLParameterConsistency:
     """Tests to ensure URL parameter is used consistently across functions."""
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_episodes_metadata_and_fetch_crc32_links_use_same_url(self, mock_get):
         """Test that both fetch_episodes_metadata and fetch_crc32_links use the same URL when provided."""
         html_with_results = """
@@ -714,6 +1159,17 @@ class TestURLParameterConsistency:
         for url in episodes_urls:
             assert url.startswith(test_url + "&p=") or url == test_url + "&p=1"
 
+    def test_page_url_appends_page_to_search_query(self):
+        """Test that the page number is added to the search URL's existing query."""
+        test_url = "https://nyaa.si/?f=0&c=0_0&q=one+pace+1080p&o=asc"
+
+        assert acepace._page_url(test_url, 3) == test_url + "&p=3"
+
+    def test_page_url_replaces_existing_page(self):
+        """Test that a page already present in the URL is replaced rather than duplicated."""
+        assert acepace._page_url("https://nyaa.si/?q=one+pace&p=5", 2) == "https://nyaa.si/?q=one+pace&p=2"
+        assert acepace._page_url("https://nyaa.si/", 2) == "https://nyaa.si/?p=2"
+
     @patch('acepace.fetch_episodes_metadata')
     def test_update_episodes_index_db_passes_url_to_fetch_episodes_metadata(self, mock_fetch, temp_dir):
         """Test that update_episodes_index_db correctly passes URL to fetch_episodes_metadata."""
@@ -724,7 +1180,7 @@ class TestURLParameterConsistency:
             acepace.update_episodes_index_db(test_url)
             
             # Verify fetch_episodes_metadata was called with the URL
-            mock_fetch.assert_called_once_with(test_url)
+            mock_fetch.assert_called_once_with(test_url, no_crc_pages=set())
             
             conn = acepace.init_episodes_db()
             conn.close()
@@ -739,7 +1195,7 @@ class TestURLParameterConsistency:
             acepace.update_episodes_index_db()
             
             # Verify fetch_episodes_metadata was called with None (which triggers default)
-            mock_fetch.assert_called_once_with(None)
+            mock_fetch.assert_called_once_with(None, no_crc_pages=set())
             
             conn = acepace.init_episodes_db()
             conn.close()
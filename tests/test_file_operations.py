@@ -1,8 +1,10 @@
 """Unit tests for file operations and renaming."""
 import pytest
 import os
+import csv
 import sys
 import shutil
+import sqlite3
 import re
 from unittest.mock import patch, MagicMock, mock_open
 
@@ -12,6 +14,17 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import acepace
 
 
+def _add_episode_titles(crc32_to_title):
+    """Insert CRC32 -> title rows into the (patched) episodes index database."""
+    episodes_conn = acepace.init_episodes_db()
+    episodes_conn.executemany(
+        "INSERT INTO episodes_index (crc32, title, page_link, magnet_link) VALUES (?, ?, '', '')",
+        list(crc32_to_title.items())
+    )
+    episodes_conn.commit()
+    episodes_conn.close()
+
+
 class TestFileRenaming:
     """Tests for file renaming functionality."""
 
@@ -68,12 +81,24 @@ class TestFileRenaming:
 
     def test_rename_sanitizes_filename(self):
         """Test that filenames are sanitized to remove problematic characters."""
-        title = "[One Pace] Episode 1: Test <1080p> | Special.mkv"
-        sanitized = re.sub(r'[\\/*?:"<>|]', "", title).strip()
-        assert ":" not in sanitized
-        assert "<" not in sanitized
-        assert ">" not in sanitized
-        assert "|" not in sanitized
+        title = ' [One Pace] Episode 1: Test <1080p> | "Special" a/b\\c*?.mkv '
+        sanitized = title.translate(acepace.FILENAME_SANITIZE_TABLE).strip()
+        assert sanitized == re.sub(r'[\\/*?:"<>|]', "", title).strip()
+        assert sanitized == "[One Pace] Episode 1 Test 1080p  Special abc.mkv"
+
+    def test_build_rename_plan_sanitizes_and_skips(self, temp_dir):
+        """Test the rename plan: sanitized targets, already-named files skipped."""
+        matches = [
+            (os.path.join(temp_dir, "old.mkv"), "[One Pace] Episode 1: Romance Dawn? [1080p].mkv"),
+            (os.path.join(temp_dir, "[One Pace] Episode 2 [1080p].mkv"), "[One Pace] Episode 2 [1080p].mkv"),
+        ]
+
+        rename_plan = acepace._build_rename_plan(matches)
+
+        assert rename_plan == [
+            (os.path.join(temp_dir, "old.mkv"),
+             os.path.join(temp_dir, "[One Pace] Episode 1 Romance Dawn [1080p].mkv")),
+        ]
 
     def test_rename_skips_files_without_match(self, temp_dir):
         """Test that files without CRC32 match are skipped."""
@@ -155,8 +180,8 @@ class TestFileRenaming:
             acepace.calculate_local_crc32(temp_dir, conn)
             actual_crc32 = list(acepace.calculate_local_crc32(temp_dir, conn))[0]
 
-            with patch('acepace.load_crc32_to_title_from_index') as mock_load:
-                mock_load.return_value = {actual_crc32: "[One Pace] Episode 1 [1080p].mkv"}
+            with patch('acepace.EPISODES_DB_NAME', os.path.join(temp_dir, 'episodes.db')):
+                _add_episode_titles({actual_crc32: "[One Pace] Episode 1 [1080p].mkv"})
                 with patch('acepace._get_rename_confirmation') as mock_confirm:
                     with patch('acepace._execute_rename') as mock_execute:
                         acepace.rename_local_files(conn, dry_run=True)
@@ -164,14 +189,57 @@ class TestFileRenaming:
                         mock_execute.assert_not_called()
             conn.close()
 
+    def test_rename_summary_counts_distinct_local_crc32s(self, temp_dir):
+        """Test that the rename summary reports planned renames out of distinct cached CRC32s."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            conn.executemany(
+                "INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+                [(os.path.join(temp_dir, "a.mkv"), "A1B2C3D4"), (os.path.join(temp_dir, "b.mkv"), "E5F6A7B8")]
+            )
+            conn.commit()
+
+            with patch('acepace.EPISODES_DB_NAME', os.path.join(temp_dir, 'episodes.db')):
+                _add_episode_titles({"A1B2C3D4": "[One Pace] Episode 1 [1080p].mkv"})
+                with patch('builtins.print') as mock_print:
+                    acepace.rename_local_files(conn, dry_run=True)
+            conn.close()
+
+        printed = [str(call) for call in mock_print.call_args_list]
+        assert any("1/2 files will be renamed." in line for line in printed)
+
+    def test_load_rename_matches_joins_episodes_index(self, temp_dir):
+        """Test that local files are matched to episode titles by CRC32 through the attached index."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')), \
+                patch('acepace.EPISODES_DB_NAME', os.path.join(temp_dir, 'episodes.db')):
+            conn = acepace.init_db()
+            conn.executemany(
+                "INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+                [("/media/a.mkv", "A1B2C3D4"), ("/media/b.mkv", "E5F6A7B8"), ("/media/c.mkv", "A9B0C1D2")]
+            )
+            conn.commit()
+            _add_episode_titles({"A1B2C3D4": "[One Pace] Episode 1 [1080p].mkv", "A9B0C1D2": ""})
+
+            matches = acepace._load_rename_matches(conn)
+            attached = [row[1] for row in conn.execute("PRAGMA database_list")]
+            conn.close()
+
+        assert matches == [("/media/a.mkv", "[One Pace] Episode 1 [1080p].mkv")]
+        assert "episodes" not in attached
+
     def test_ensure_crc32_cache_complete_runs_calculation_when_missing(self, temp_dir):
         """When cache is missing CRC32s for some files, calculate_local_crc32 is called."""
         conn = MagicMock()
-        with patch('acepace._count_video_files') as mock_count:
-            with patch('acepace.calculate_local_crc32') as mock_calc:
-                mock_count.return_value = (3, 1)
-                acepace._ensure_crc32_cache_complete(temp_dir, conn)
-                mock_calc.assert_called_once_with(temp_dir, conn)
+        video_files = [(os.path.join(temp_dir, f"ep{i}.mkv"),) * 2 for i in range(3)]
+        with patch('acepace._scan_video_files', return_value=video_files) as mock_scan:
+            with patch('acepace._count_video_files') as mock_count:
+                with patch('acepace.calculate_local_crc32') as mock_calc:
+                    mock_count.return_value = (3, 1)
+                    acepace._ensure_crc32_cache_complete(temp_dir, conn)
+                    # One scan, shared by the count and the calculation
+                    mock_scan.assert_called_once_with(temp_dir)
+                    mock_count.assert_called_once_with(temp_dir, conn, video_files)
+                    mock_calc.assert_called_once_with(temp_dir, conn, video_files)
 
     def test_ensure_crc32_cache_complete_skips_when_up_to_date(self, temp_dir):
         """When all files are in cache, calculate_local_crc32 is not called."""
@@ -191,6 +259,65 @@ class TestFileRenaming:
                 acepace._ensure_crc32_cache_complete(temp_dir, conn)
                 mock_calc.assert_not_called()
 
+    def test_execute_rename_updates_cache_paths(self, temp_dir):
+        """Test that renamed files keep their cached CRC32 under the new path, and skipped ones are untouched."""
+        for name in ("a.mkv", "b.mkv", "taken.mkv"):
+            with open(os.path.join(temp_dir, name), "wb") as f:
+                f.write(name.encode())
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            acepace.calculate_local_crc32(temp_dir, conn)
+            old_a = acepace.normalize_file_path(os.path.join(temp_dir, "a.mkv"))
+            old_b = acepace.normalize_file_path(os.path.join(temp_dir, "b.mkv"))
+            new_a = os.path.join(os.path.dirname(old_a), "Episode 1.mkv")
+            taken = os.path.join(os.path.dirname(old_b), "taken.mkv")
+            crc32_by_path = dict(conn.execute("SELECT file_path, crc32 FROM crc32_cache").fetchall())
+
+            with patch('builtins.print'):
+                acepace._execute_rename([(old_a, new_a), (old_b, taken)], conn)
+
+            cached = dict(conn.execute("SELECT file_path, crc32 FROM crc32_cache").fetchall())
+            conn.close()
+
+        assert os.path.exists(new_a) and not os.path.exists(old_a)
+        assert cached[new_a] == crc32_by_path[old_a]
+        assert old_a not in cached
+        assert cached[old_b] == crc32_by_path[old_b]
+
+    def test_update_renamed_paths_replaces_stale_row_at_target(self, temp_dir):
+        """Test that a stale row already cached under the new path doesn't abort the batch."""
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            conn.executemany(
+                "INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)",
+                [("/lib/a.mkv", "AAAAAAAA"), ("/lib/b.mkv", "BBBBBBBB"), ("/lib/Episode 2.mkv", "0BSOLETE")],
+            )
+            conn.commit()
+
+            acepace._update_renamed_paths(
+                conn, [("/lib/Episode 1.mkv", "/lib/a.mkv"), ("/lib/Episode 2.mkv", "/lib/b.mkv")]
+            )
+
+            in_transaction = conn.in_transaction
+            cached = dict(conn.execute("SELECT file_path, crc32 FROM crc32_cache").fetchall())
+            conn.close()
+
+        assert not in_transaction
+        assert cached == {"/lib/Episode 1.mkv": "AAAAAAAA", "/lib/Episode 2.mkv": "BBBBBBBB"}
+
+    def test_update_renamed_paths_rolls_back_on_error(self):
+        """Test that a failed update is rolled back instead of leaving the transaction open."""
+        conn = MagicMock()
+        conn.executemany.side_effect = sqlite3.OperationalError("database is locked")
+
+        with patch('builtins.print') as mock_print:
+            acepace._update_renamed_paths(conn, [("/lib/new.mkv", "/lib/old.mkv")])
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        assert "Failed to update the database" in mock_print.call_args.args[0]
+
 
 class TestCSVExport:
     """Tests for CSV export functionality."""
@@ -236,3 +363,123 @@ class TestCSVExport:
             last_export = acepace.get_metadata(conn, "last_db_export")
             assert last_export is not None
             conn.close()
+
+    def test_export_db_to_csv_writes_all_rows(self, temp_dir):
+        """Test that every cached row is written after the header."""
+        csv_path = os.path.join(temp_dir, 'export.csv')
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')):
+            conn = acepace.init_db()
+            rows = [(f"/path/to/file{i}.mkv", f"{i:08X}") for i in range(3)]
+            conn.executemany("INSERT INTO crc32_cache (file_path, crc32) VALUES (?, ?)", rows)
+            conn.commit()
+
+            with patch('acepace.get_config_path', return_value=csv_path):
+                acepace.export_db_to_csv(conn)
+            conn.close()
+
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            written = list(csv.reader(f))
+        assert written[0] == ["File Path", "CRC32"]
+        assert sorted(tuple(r) for r in written[1:]) == rows
+
+    def test_export_db_to_csv_skips_unchanged_cache(self, temp_dir):
+        """Test that an unchanged cache isn't exported again, but any cache write triggers a new export."""
+        csv_path = os.path.join(temp_dir, acepace.DB_CSV_FILENAME)
+        with patch('acepace.get_config_path', side_effect=lambda name: os.path.join(temp_dir, name)):
+            conn = acepace.init_db()
+            acepace._store_crc32_rows(conn.cursor(), conn, [("/path/to/old.mkv", "A1B2C3D4", 10, 1.0)])
+            acepace.export_db_to_csv(conn)
+
+            with patch('acepace.open') as mock_open:
+                acepace.export_db_to_csv(conn)
+                mock_open.assert_not_called()
+
+            acepace._update_renamed_paths(conn, [("/path/to/new.mkv", "/path/to/old.mkv")])
+            acepace.export_db_to_csv(conn)
+            conn.close()
+
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            written = list(csv.reader(f))
+        assert written[1:] == [["/path/to/new.mkv", "A1B2C3D4"]]
+
+    def test_save_missing_episodes_csv_writes_rows(self, temp_dir):
+        """Test that missing episodes are written with title, link and magnet, falling back for unknown CRC32s."""
+        csv_path = os.path.join(temp_dir, 'missing.csv')
+        with patch('acepace.get_config_path', return_value=csv_path):
+            acepace._save_missing_episodes_csv(
+                ["A1B2C3D4", "E5F6A7B8"],
+                {"A1B2C3D4": "[One Pace] Episode 1 [1080p][A1B2C3D4].mkv"},
+                {"A1B2C3D4": "https://nyaa.si/view/1"},
+                {"A1B2C3D4": "magnet:?xt=urn:btih:abc"},
+            )
+
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            written = list(csv.reader(f))
+        assert written == [
+            ["Title", "Page Link", acepace.CSV_COLUMN_MAGNET_LINK],
+            ["[One Pace] Episode 1 [1080p][A1B2C3D4].mkv", "https://nyaa.si/view/1", "magnet:?xt=urn:btih:abc"],
+            ["[CRC32: E5F6A7B8]", "", ""],
+        ]
+
+
+class TestVideoFileScanning:
+    """Tests for scanning the local library for video files."""
+
+    def test_scan_video_files_recurses_and_filters_extensions(self, temp_dir):
+        """Test that scanning finds video files in subfolders and ignores other files."""
+        os.makedirs(os.path.join(temp_dir, "Arc 1", "extras"))
+        for rel_path in ("a.mkv", os.path.join("Arc 1", "b.MP4"), os.path.join("Arc 1", "extras", "c.avi"),
+                         "notes.txt", os.path.join("Arc 1", "cover.jpg")):
+            with open(os.path.join(temp_dir, rel_path), "wb") as f:
+                f.write(b"x")
+
+        video_files = acepace._scan_video_files(temp_dir)
+
+        names = sorted(os.path.basename(path) for path, _ in video_files)
+        assert names == ["a.mkv", "b.MP4", "c.avi"]
+        for path, normalized_path in video_files:
+            assert normalized_path == acepace.normalize_file_path(path)
+
+    def test_scan_video_files_matches_only_final_extension(self, temp_dir):
+        """Test that partial downloads and names merely containing an extension are skipped."""
+        for name in ("ep.mkv", "ep2.mkv.part", "mkv", "ep3.mkv.srt", "EP4.AVI", "Ep5.Mp4"):
+            with open(os.path.join(temp_dir, name), "wb") as f:
+                f.write(b"x")
+
+        video_files = acepace._scan_video_files(temp_dir)
+
+        assert sorted(os.path.basename(path) for path, _ in video_files) == ["EP4.AVI", "Ep5.Mp4", "ep.mkv"]
+
+    def test_scan_video_files_does_not_follow_symlinked_dirs(self, temp_dir):
+        """Test that symlinked directories are not descended into (same as os.walk)."""
+        target = os.path.join(temp_dir, "target")
+        library = os.path.join(temp_dir, "library")
+        os.makedirs(target)
+        os.makedirs(library)
+        with open(os.path.join(target, "ep.mkv"), "wb") as f:
+            f.write(b"x")
+        try:
+            os.symlink(target, os.path.join(library, "linked"))
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported on this platform")
+
+        assert acepace._scan_video_files(library) == []
+
+    def test_report_scans_library_once(self, temp_dir):
+        """Test that the missing report counts and hashes from a single library scan."""
+        with open(os.path.join(temp_dir, "ep.mkv"), "wb") as f:
+            f.write(b"episode")
+        args = MagicMock()
+        args.url = "https://nyaa.si/?f=0&c=0_0&q=one+pace&o=asc"
+
+        with patch('acepace.DB_NAME', os.path.join(temp_dir, 'test.db')), \
+                patch('acepace.MISSING_CSV_FILENAME', os.path.join(temp_dir, 'missing.csv')), \
+                patch('acepace._scan_video_files', wraps=acepace._scan_video_files) as mock_scan, \
+                patch('acepace.init_episodes_db'), \
+                patch('acepace.get_episodes_metadata', return_value="2025-01-01 00:00:00"), \
+                patch('acepace._load_episodes_from_database', return_value=({}, {}, {}, 0)):
+            conn = acepace.init_db()
+            acepace._generate_missing_episodes_report(conn, temp_dir, args)
+            conn.close()
+
+        mock_scan.assert_called_once_with(temp_dir)
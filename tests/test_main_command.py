@@ -267,11 +267,12 @@ class TestURLParameterPropagation:
             # Verify update_episodes_index_db was called with URL and force_update
             mock_update.assert_called_once_with(test_url, force_update=True)
 
+    @patch('acepace._show_episodes_metadata_status')
     @patch('acepace._validate_url')
     @patch('acepace.init_db')
     @patch('acepace._get_folder_from_args')
     @patch('acepace._handle_rename_command')
-    def test_rename_receives_url_parameter(self, mock_rename, mock_folder, mock_init_db, mock_validate):
+    def test_rename_receives_url_parameter(self, mock_rename, mock_folder, mock_init_db, mock_validate, mock_show_status):
         """Test that --rename receives URL parameter from args."""
         mock_validate.return_value = True
         mock_init_db.return_value = MagicMock()
@@ -301,11 +302,12 @@ class TestURLParameterPropagation:
             assert call_args[1]["dry_run"] is False
             assert call_args[1]["folder"] == "/media"
 
+    @patch('acepace._show_episodes_metadata_status')
     @patch('acepace._validate_url')
     @patch('acepace.init_db')
     @patch('acepace._get_folder_from_args')
     @patch('acepace._handle_rename_command')
-    def test_rename_with_dry_run_passes_dry_run_true(self, mock_rename, mock_folder, mock_init_db, mock_validate):
+    def test_rename_with_dry_run_passes_dry_run_true(self, mock_rename, mock_folder, mock_init_db, mock_validate, mock_show_status):
         """Test that --rename --dry-run passes dry_run=True to _handle_rename_command."""
         mock_validate.return_value = True
         mock_init_db.return_value = MagicMock()
@@ -41,7 +41,36 @@ class TestMissingEpisodeDetection:
             
             conn.close()
 
-    @patch('acepace.requests.get')
+    def test_calculate_missing_episodes_keeps_nyaa_order(self):
+        """Test that missing episodes are listed in Nyaa's order, not set order."""
+        crc32_to_link = {
+            crc32: f"https://nyaa.si/view/{idx}"
+            for idx, crc32 in enumerate(["D4C3B2A1", "A1B2C3D4", "9F8E7D6C", "E5F6A7B8", "0A1B2C3D"])
+        }
+        local_crc32s = {"A1B2C3D4", "E5F6A7B8"}
+
+        missing = acepace._calculate_missing_episodes(crc32_to_link, local_crc32s)
+
+        assert missing == ["D4C3B2A1", "9F8E7D6C", "0A1B2C3D"]
+
+    def test_load_old_missing_crc32s_from_previous_csv(self, temp_dir):
+        """Test that CRC32s are read back from the previous missing episodes CSV."""
+        csv_path = os.path.join(temp_dir, acepace.MISSING_CSV_FILENAME)
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Title", "Page Link", "Magnet Link"])
+            writer.writerow(["[One Pace] Episode 1 [1080p][a1b2c3d4].mkv", "", ""])
+            writer.writerow([])
+            writer.writerow(["Title without a tag", "", ""])
+            writer.writerow(["[One Pace] Episode 2 [1080p][E5F6A7B8].mkv", "", ""])
+
+        with patch('acepace.get_config_path', return_value=csv_path):
+            assert acepace._load_old_missing_crc32s() == {"A1B2C3D4", "E5F6A7B8"}
+
+        with patch('acepace.get_config_path', return_value=os.path.join(temp_dir, "none.csv")):
+            assert acepace._load_old_missing_crc32s() == set()
+
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_crc32_links_from_nyaa(self, mock_get):
         """Test fetching CRC32 links from Nyaa."""
         html_with_results = """
@@ -95,7 +124,7 @@ class TestMissingEpisodeDetection:
         assert "A1B2C3D4" in crc32_to_text
         assert "magnet:?xt=urn:btih:abc123" in crc32_to_magnet.values()
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_crc32_links_filters_quality(self, mock_get):
         """Test that fetch_crc32_links filters episodes by quality (1080p only)."""
         html_with_mixed_quality = """
@@ -153,7 +182,7 @@ class TestMissingEpisodeDetection:
         assert "E5F6A7B8" not in crc32_to_link  # 720p - should be excluded
         assert "A9B0C1D2" not in crc32_to_link  # 480p - should be excluded
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_crc32_links_stops_on_empty_page(self, mock_get):
         """Test that fetching processes all pages based on pagination."""
         # First page has results and pagination showing 2 pages
@@ -203,7 +232,7 @@ class TestMissingEpisodeDetection:
         assert len(crc32_to_link) == 1
         assert last_page == 2  # Processed both pages
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_title_by_crc32(self, mock_get):
         """Test fetching title by CRC32 from Nyaa search."""
         html = """
@@ -229,7 +258,7 @@ class TestMissingEpisodeDetection:
         
         assert title == "[One Pace] Episode 1 [1080p][A1B2C3D4].mkv"
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_title_by_crc32_no_match(self, mock_get):
         """Test fetching title when CRC32 not found."""
         html = """
@@ -250,7 +279,7 @@ class TestMissingEpisodeDetection:
         
         assert title is None
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_title_by_crc32_multiple_matches(self, mock_get):
         """Test fetching title when multiple matches found."""
         html = """
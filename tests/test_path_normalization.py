@@ -4,7 +4,6 @@ import os
 import sys
 import tempfile
 from unittest.mock import patch, MagicMock
-from bs4 import BeautifulSoup
 
 # Add parent directory to path to import acepace
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,14 +17,17 @@ def _create_test_row(title):
         title: Episode title to use in the row
     Returns: BeautifulSoup row element"""
     row_html = f"""
-    <tr>
-        <td>
-            <a href="/view/12345" title="{title}">{title}</a>
-            <a href="magnet:?xt=urn:btih:abc123">Magnet</a>
-        </td>
-    </tr>
+    <table class="torrent-list">
+        <tr>
+            <td>
+                <a href="/view/12345" title="{title}">{title}</a>
+                <a href="magnet:?xt=urn:btih:abc123">Magnet</a>
+            </td>
+        </tr>
+    </table>
     """
-    soup = BeautifulSoup(row_html, "html.parser")
+    # Parse the way listing pages are parsed in production (HTML_PARSER + strainer)
+    soup = acepace._parse_listing_page(row_html)
     return soup.find("tr")
 
 
@@ -230,6 +232,31 @@ class TestPathNormalizationInCountFiles:
             
             conn.close()
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="creating symlinks needs privileges on Windows")
+    def test_scan_video_files_normalizes_without_realpath_per_file(self, temp_dir):
+        """Test that scanned paths match normalize_file_path while realpath runs once per symlink, not per file."""
+        library = os.path.join(temp_dir, "library")
+        os.makedirs(os.path.join(library, "Arc 1"))
+        for name in ("Arc 1/ep1.mkv", "Arc 1/ep2.mkv", "ep3.mp4"):
+            with open(os.path.join(library, name), "wb") as f:
+                f.write(b"x")
+        outside_file = os.path.join(temp_dir, "outside.mkv")
+        with open(outside_file, "wb") as f:
+            f.write(b"y")
+        os.symlink(outside_file, os.path.join(library, "linked.mkv"))
+        library_link = os.path.join(temp_dir, "library_link")
+        os.symlink(library, library_link)
+
+        with patch('acepace.os.path.realpath', wraps=os.path.realpath) as mock_realpath:
+            video_files = acepace._scan_video_files(library_link)
+
+        assert sorted(normalized for _, normalized in video_files) == sorted(
+            acepace.normalize_file_path(file_path) for file_path, _ in video_files
+        )
+        assert acepace.normalize_file_path(outside_file) in {normalized for _, normalized in video_files}
+        assert len(video_files) == 4
+        assert mock_realpath.call_count == 2  # The scanned folder and the symlinked file
+
 
 class TestQualityFiltering:
     """Tests for quality filtering in episode processing."""
@@ -291,7 +318,7 @@ class TestQualityFiltering:
             expected_crc32_in_link="A1B2C3D4"
         )
 
-    @patch('acepace.requests.get')
+    @patch('acepace._HTTP_SESSION.get')
     def test_fetch_crc32_links_filters_by_quality(self, mock_get):
         """Test that fetch_crc32_links filters episodes by quality."""
         html_with_mixed_quality = """